@@ -23,45 +23,62 @@ class ActuatorObject:
         self.tcp_client_object = tcp_client_object
         self.value = 0.0
         self._value_lock = threading.Lock()
+        # How an actuator reaches the target is fixed at construction, so pick
+        # the send path once instead of re-checking it on every set*Value call
+        if tcp_client_object:
+            self._send_value = self._send_via_client_object
+            self._command_for = self._command_via_client_object
+        elif command_builder:
+            self._send_value = self._send_via_command_builder
+            self._command_for = self._command_via_command_builder
+        else:
+            self._send_value = self._send_noop
+            self._command_for = self._command_noop
 
     def setAnalogValue(self, value: float):
         with self._value_lock:
             self.value = value
-        if self.tcp_client_object:
-            self.tcp_client_object.send_actuator_command(self.name, value, self.label)
-        elif self.command_builder:
-            command = self.command_builder(self.name, value)
-            if command:
-                if not self.tcp_client.is_connected():
-                    if not self.tcp_client.connect():
-                        logger.error(
-                            f"Failed to connect to target for actuator {self.name}"
-                        )
-                        return
-                response = self.tcp_client.send_command(command)
-                if response:
-                    logger.info(
-                        f"Actuator {self.name} (label: {self.label}) -> Command: {command} -> Response: {response}"
-                    )
+        self._send_value(value)
 
     def setDigitalValue(self, value: bool):
+        value = 1.0 if value else 0.0
         with self._value_lock:
-            self.value = 1.0 if value else 0.0
-        if self.tcp_client_object:
-            self.tcp_client_object.send_actuator_command(
-                self.name, self.value, self.label
-            )
-        elif self.command_builder:
-            command = self.command_builder(self.name, self.value)
-            if command:
-                if not self.tcp_client.is_connected():
-                    if not self.tcp_client.connect():
-                        logger.error(
-                            f"Failed to connect to target for actuator {self.name}"
-                        )
-                        return
-                response = self.tcp_client.send_command(command)
-                if response:
-                    logger.info(
-                        f"Actuator {self.name} (label: {self.label}) -> Command: {command} -> Response: {response}"
-                    )
+            self.value = value
+        self._send_value(value)
+
+    def stageAnalogValue(self, value: float) -> Optional[str]:
+        """Record value like setAnalogValue, but return the target command
+        instead of sending it, so the caller can batch several actuators."""
+        with self._value_lock:
+            self.value = value
+        return self._command_for(value)
+
+    def _send_via_client_object(self, value: float):
+        self.tcp_client_object.send_actuator_command(self.name, value, self.label)
+
+    def _send_via_command_builder(self, value: float):
+        command = self.command_builder(self.name, value)
+        if command:
+            response = self.tcp_client.send_command(command)
+            if response:
+                logger.info(
+                    "Actuator %s (label: %s) -> Command: %s -> Response: %s",
+                    self.name,
+                    self.label,
+                    command,
+                    response,
+                )
+
+    def _send_noop(self, value: float):
+        pass
+
+    def _command_via_client_object(self, value: float) -> Optional[str]:
+        return self.tcp_client_object.build_actuator_command(
+            self.name, value, self.label
+        )
+
+    def _command_via_command_builder(self, value: float) -> Optional[str]:
+        return self.command_builder(self.name, value)
+
+    def _command_noop(self, value: float) -> Optional[str]:
+        return None
@@ -0,0 +1,593 @@
+# Automatic-mode state machine. Kept free of GUI imports so it can be driven
+# (and tested) without loading customtkinter; host_main re-exports these names.
+import functools
+import logging
+import threading
+import os
+import importlib.util
+from collections import namedtuple
+from enum import IntEnum, auto
+from types import MappingProxyType
+
+target_codebase_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Target_Codebase'))
+target_base_classes_path = os.path.join(target_codebase_path, 'base_classes.py')
+spec = importlib.util.spec_from_file_location("target_base_classes", target_base_classes_path)
+target_base_classes = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(target_base_classes)
+ADCInterface = target_base_classes.ADCInterface
+
+logger = logging.getLogger("AutoController")
+
+
+class State(IntEnum):
+    ALL_OFF = auto()
+    ROUGH_PUMP_DOWN = auto()
+    RP_DOWN_TURBO = auto()
+    TURBO_PUMP_DOWN = auto()
+    TP_DOWN_MAIN = auto()
+    SETTLE_STEADY_PRESSURE = auto()
+    SETTLING_10KV = auto()
+    NOMINAL_27KV = auto()
+    DEENERGIZING = auto()
+    CLOSING_MAIN = auto()
+    VENTING_FORELINE = auto()
+    VENTING_ATM = auto()
+
+
+class Event(IntEnum):
+    START = auto()
+    APS_FORELINE_LT_100MT = auto()
+    APS_TURBO_LT_100MT = auto()
+    APS_TURBO_LT_0_1MT = auto()
+    APS_MAIN_LT_0_1MT = auto()
+    APS_MAIN_EQ_0_1_STEADY = auto()
+    STEADY_STATE_VOLTAGE = auto()
+    STEADY_STATE_CURRENT = auto()
+    CMF_EQ_0 = auto()
+    CMF_EQ_50 = auto()
+    STOP_CMD = auto()
+    ZERO_KV_STEADY = auto()
+    TIMEOUT_5S = auto()
+    TIMEOUT_6S = auto()
+    TIMEOUT_10S = auto()
+    APS_EQ_1_ATM = auto()
+    FAULT_FORELINE_TURBO = auto()
+    FAULT_MAIN_TURBO = auto()
+
+
+# Outputs each state drives on entry: atm, foreline, fusor and deuterium valve
+# positions and mechanical/turbo pump power (0-100%), then supply voltage in
+# volts, the unit the supply is commanded in, so entries need no conversion.
+# Rows follow State order so a state's row is STATE_OUTPUTS[state - 1].
+STATE_OUTPUT_ACTUATORS = (
+    "atm_valve",
+    "mech_pump",
+    "turbo_pump",
+    "foreline_valve",
+    "fusor_valve",
+    "deuterium_valve",
+)
+STATE_OUTPUT_VOLTS = len(STATE_OUTPUT_ACTUATORS)
+STATE_OUTPUTS = (
+    # atm, mech, turbo, foreline, fusor, deuterium, V
+    (0, 0, 0, 0, 0, 0, 0.0),  # ALL_OFF
+    (0, 100, 0, 100, 0, 0, 0.0),  # ROUGH_PUMP_DOWN
+    (0, 100, 0, 100, 0, 0, 0.0),  # RP_DOWN_TURBO
+    (0, 100, 100, 100, 0, 0, 0.0),  # TURBO_PUMP_DOWN
+    (0, 100, 100, 100, 100, 0, 0.0),  # TP_DOWN_MAIN
+    (0, 100, 100, 100, 10, 90, 0.0),  # SETTLE_STEADY_PRESSURE
+    (0, 100, 100, 100, 10, 90, 10000.0),  # SETTLING_10KV
+    (0, 100, 100, 100, 10, 90, 27000.0),  # NOMINAL_27KV
+    (0, 100, 100, 100, 100, 0, 0.0),  # DEENERGIZING
+    (0, 100, 100, 100, 0, 0, 0.0),  # CLOSING_MAIN
+    (0, 100, 0, 100, 0, 0, 0.0),  # VENTING_FORELINE
+    (0, 100, 0, 0, 0, 0, 0.0),  # VENTING_ATM
+)
+assert len(STATE_OUTPUTS) == len(State)
+# Stands in for "last sent" when nothing can be assumed about the outputs
+_UNKNOWN_OUTPUTS = (None,) * len(STATE_OUTPUTS[0])
+
+# Values of the telemetry "APS_location" field. The host fills the field
+# from these constants, so the guards' equality checks hit the identity
+# fast path instead of comparing characters.
+APS_FORELINE = "Foreline"
+APS_TURBO = "Turbo"
+APS_MAIN = "Main"
+
+
+def _transition_table(fsm) -> list:
+    """Lay out an FSM dict as a [state][event] -> next state table.
+
+    Also checks the FSM is complete: every state has a way out, and every
+    state but ALL_OFF answers STOP_CMD so the emergency stop always works.
+    """
+    table = [[None] * (len(Event) + 1) for _ in range(len(State) + 1)]
+    for (state, event), next_state in fsm.items():
+        table[state][event] = next_state
+    for state in State:
+        row = table[state]
+        if not any(row):
+            raise ValueError(f"{state.name} has no outgoing transitions")
+        if state != State.ALL_OFF and not row[Event.STOP_CMD]:
+            raise ValueError(f"{state.name} does not handle STOP_CMD")
+    return table
+
+
+# The telemetry fields the FSM guards read, pulled out of the packet dict once
+Telemetry = namedtuple("Telemetry", "aps_loc aps_p v_kv i_mA")
+
+
+class RemoteADC(ADCInterface):
+    
+    def __init__(self, tcp_client, command_handler):
+        super().__init__(spi_port=0, spi_device=0)
+        self.tcp_client = tcp_client
+        self.command_handler = command_handler
+        self._is_initialized = True
+        self._cache = [None] * 8
+        self._cache_lock = threading.Lock()
+    
+    def initialize(self) -> bool:
+
+        self._is_initialized = True
+        return True
+    
+    def read_channel(self, channel: int) -> int:
+        if not self.validate_channel(channel):
+            return None
+        
+        with self._cache_lock:
+            cached = self._cache[channel]
+            if cached is not None and not isinstance(cached, str):
+                return cached
+        
+        try:
+            if self.tcp_client and self.tcp_client.is_connected():
+                command = f"READ_ADC_CHANNEL:{channel}"
+                response = self.tcp_client.send_command(command)
+                
+                if response:
+                    parts = response.split("|")
+                    for part in parts:
+                        if f"ADC_CH{channel}:" in part:
+                            try:
+                                value_str = part.split(":")[1].strip()
+                                if value_str.upper() in ["FLOATING", "UNUSED"]:
+                                    return None
+                                value = int(value_str)
+                                with self._cache_lock:
+                                    self._cache[channel] = value
+                                return value
+                            except (ValueError, IndexError):
+                                pass
+        except Exception as e:
+            logger.warning(f"Error reading ADC channel {channel} from target: {e}")
+        
+        return None
+    
+    def read_all_channels(self) -> list:
+        """Read all ADC channels from target."""
+        try:
+            if self.tcp_client and self.tcp_client.is_connected():
+                command = "READ_ACTIVE_ADC_CHANNELS"
+                response = self.tcp_client.send_command(command)
+                
+                if response:
+                    values = [None] * 8
+                    parts = response.split("|")
+                    
+                    for part in parts:
+                        if "ADC_DATA:" in part:
+                            try:
+                                data_str = part.split(":")[1].strip()
+                                data_list = [x.strip() for x in data_str.split(",")]
+                                for i, val in enumerate(data_list[:8]):
+                                    if val.upper() in ["FLOATING", "UNUSED"]:
+                                        values[i] = None
+                                    else:
+                                        try:
+                                            values[i] = int(val)
+                                        except ValueError:
+                                            values[i] = None
+                                with self._cache_lock:
+                                    self._cache = values.copy()
+                                return values
+                            except (ValueError, IndexError):
+                                pass
+                    
+                    for ch in range(8):
+                        for part in parts:
+                            if f"ADC_CH{ch}:" in part:
+                                try:
+                                    value_str = part.split(":")[1].strip()
+                                    if value_str.upper() in ["FLOATING", "UNUSED"]:
+                                        values[ch] = None
+                                    else:
+                                        values[ch] = int(value_str)
+                                except (ValueError, IndexError):
+                                    pass
+                    
+                    with self._cache_lock:
+                        self._cache = values.copy()
+                    return values
+        except Exception as e:
+            logger.warning(f"Error reading all ADC channels from target: {e}")
+        
+        return [None] * 8
+    
+    def cleanup(self):
+        """No cleanup needed for remote ADC."""
+        pass
+    
+    def update_cache(self, channel: int, value):
+        if 0 <= channel < 8:
+            with self._cache_lock:
+                if isinstance(value, str):
+                    if value.upper() in ["FLOATING", "UNUSED", "---"]:
+                        self._cache[channel] = None
+                    else:
+                        try:
+                            self._cache[channel] = int(value)
+                        except ValueError:
+                            self._cache[channel] = None
+                else:
+                    self._cache[channel] = value
+
+
+class AutoController:
+    # The FSM is fixed, so it and the tables derived from it are built once
+    # at import rather than per instance
+    FSM = MappingProxyType({
+        (State.ALL_OFF, Event.START): State.ROUGH_PUMP_DOWN,
+        (State.ROUGH_PUMP_DOWN, Event.APS_FORELINE_LT_100MT): State.RP_DOWN_TURBO,
+        (State.RP_DOWN_TURBO, Event.APS_TURBO_LT_100MT): State.TURBO_PUMP_DOWN,
+        (State.RP_DOWN_TURBO, Event.FAULT_FORELINE_TURBO): State.ALL_OFF,
+        (State.TURBO_PUMP_DOWN, Event.APS_TURBO_LT_0_1MT): State.TP_DOWN_MAIN,
+        (State.TP_DOWN_MAIN, Event.CMF_EQ_0): State.SETTLE_STEADY_PRESSURE,
+        (State.TP_DOWN_MAIN, Event.FAULT_MAIN_TURBO): State.ALL_OFF,
+        (
+            State.SETTLE_STEADY_PRESSURE,
+            Event.CMF_EQ_50,
+        ): State.SETTLING_10KV,
+        (State.SETTLING_10KV, Event.CMF_EQ_0): State.NOMINAL_27KV,
+        (State.DEENERGIZING, Event.ZERO_KV_STEADY): State.CLOSING_MAIN,
+        (State.CLOSING_MAIN, Event.TIMEOUT_6S): State.VENTING_FORELINE,
+        (State.VENTING_FORELINE, Event.TIMEOUT_5S): State.VENTING_ATM,
+        (State.VENTING_ATM, Event.TIMEOUT_10S): State.ALL_OFF,
+        # Emergency stop from any state - immediately go to ALL_OFF
+        (State.ROUGH_PUMP_DOWN, Event.STOP_CMD): State.ALL_OFF,
+        (State.RP_DOWN_TURBO, Event.STOP_CMD): State.ALL_OFF,
+        (State.TURBO_PUMP_DOWN, Event.STOP_CMD): State.ALL_OFF,
+        (State.TP_DOWN_MAIN, Event.STOP_CMD): State.ALL_OFF,
+        (State.SETTLE_STEADY_PRESSURE, Event.STOP_CMD): State.ALL_OFF,
+        (State.SETTLING_10KV, Event.STOP_CMD): State.ALL_OFF,
+        (State.NOMINAL_27KV, Event.STOP_CMD): State.DEENERGIZING,
+        (State.DEENERGIZING, Event.STOP_CMD): State.ALL_OFF,
+        (State.CLOSING_MAIN, Event.STOP_CMD): State.ALL_OFF,
+        (State.VENTING_FORELINE, Event.STOP_CMD): State.ALL_OFF,
+        (State.VENTING_ATM, Event.STOP_CMD): State.ALL_OFF,
+    })
+    # The same transitions as a [state][event] table, so a
+    # dispatch is two list indexes instead of a tuple build and dict hash
+    _transitions = _transition_table(FSM)
+
+    def __init__(
+        self,
+        actuators: dict,
+        sensors: dict = None,
+        state_callback=None,
+        log_callback=None,
+        command_handler=None,
+        send_command_callback=None,
+        tcp_client=None,
+        send_batch_callback=None,
+    ):
+        self.actuators = actuators
+        # Resolved once so state entries index a tuple instead of hashing names
+        self._output_actuators = tuple(
+            actuators.get(name) for name in STATE_OUTPUT_ACTUATORS
+        )
+        self._power_supply = actuators.get("power_supply")
+        self.sensors = sensors or {}
+        self.currentState = State.ALL_OFF
+        self.state_callback = state_callback
+        self.log_callback = log_callback
+        self.command_handler = command_handler
+        self.send_command = send_command_callback
+        # Optional: sends a list of commands to the target as one BATCH frame
+        self.send_batch = send_batch_callback
+        self._timeout_timer = None
+        self._venting_atm_timer = None
+        self._voltage_poll_timer = None
+        self._last_voltage_kv = None
+        self._last_outputs = _UNKNOWN_OUTPUTS
+        # Re-entrant so a callback that dispatches from inside a transition
+        # does not deadlock its own thread
+        self._fsm_lock = threading.RLock()
+        
+        self.adc = RemoteADC(tcp_client, command_handler) if tcp_client else None
+
+        # The commands for every state's outputs, built once: one tuple per
+        # output column of STATE_OUTPUTS, so a state entry only picks out the
+        # columns that changed
+        if command_handler:
+            builders = (
+                functools.partial(command_handler.build_set_valve_command, 1),
+                command_handler.build_set_mechanical_pump_command,
+                command_handler.build_set_turbo_pump_command,
+                functools.partial(command_handler.build_set_valve_command, 2),
+                functools.partial(command_handler.build_set_valve_command, 3),
+                functools.partial(command_handler.build_set_valve_command, 4),
+            )
+            self._state_commands = tuple(
+                tuple(
+                    tuple(filter(None, [build(value)]))
+                    for build, value in zip(builders, outputs)
+                )
+                + (tuple(self._voltage_commands(outputs[STATE_OUTPUT_VOLTS])),)
+                for outputs in STATE_OUTPUTS
+            )
+        else:
+            self._state_commands = ()
+
+        self._enter_state(State.ALL_OFF)
+
+    def _log(self, message):
+        if self.log_callback:
+            self.log_callback(message)
+        logger.info(message)
+
+    def update_adc_values(self, adc_data: list):
+        if self.adc:
+            for i, value in enumerate(adc_data[:8]):
+                if value is not None and value != "---":
+                    self.adc.update_cache(i, value)
+
+    def _set_voltage_kv(self, kv: float):
+        self._set_voltage(kv * 1000.0)
+
+    def _set_voltage(self, volts: float):
+        if self.command_handler and self.send_command:
+            for command in self._voltage_commands(volts):
+                self.send_command(command)
+        elif self._power_supply:
+            self._power_supply.setAnalogValue(volts)
+
+    def _voltage_commands(self, volts: float) -> list:
+        command = self.command_handler.build_set_voltage_command(int(volts))
+        if not command:
+            return []
+        return [command, "POWER_SUPPLY_ENABLE" if volts > 0 else "POWER_SUPPLY_DISABLE"]
+
+    def _send_commands(self, commands: list):
+        if len(commands) > 1 and self.send_batch:
+            self.send_batch(commands)
+            return
+        for command in commands:
+            self.send_command(command)
+
+    def dispatch_event(self, event: Event):
+        # Telemetry, timer and UI threads all dispatch; serialise them so a
+        # state's outputs are always sent for the state currently recorded
+        with self._fsm_lock:
+            logger.debug(
+                "[FSM] dispatch_event called: %s from state %s",
+                event.name,
+                self.currentState.name,
+            )
+            if event == Event.STOP_CMD:
+                if self._timeout_timer:
+                    self._timeout_timer.cancel()
+                    self._timeout_timer = None
+                if self._venting_atm_timer:
+                    self._venting_atm_timer.cancel()
+                    self._venting_atm_timer = None
+                if self._voltage_poll_timer:
+                    self._voltage_poll_timer.cancel()
+                    self._voltage_poll_timer = None
+            
+                next_state = self._transitions[self.currentState][event]
+                if next_state is not None:
+                    self._enter_state(next_state)
+                else:
+                    self._enter_state(State.ALL_OFF)
+                return
+        
+            next_state = self._transitions[self.currentState][event]
+            if next_state is None:
+                self._log(f"No transition for {event.name} in {self.currentState.name}")
+                logger.warning(
+                    "[FSM] No transition defined for (%s, %s)",
+                    self.currentState.name,
+                    event.name,
+                )
+                return
+            logger.info(
+                "[FSM] Transitioning from %s to %s on event %s",
+                self.currentState.name,
+                next_state.name,
+                event.name,
+            )
+            self._enter_state(next_state)
+
+    def _dispatch_timeout_event(self):
+        if self.currentState == State.CLOSING_MAIN:
+            self.dispatch_event(Event.TIMEOUT_6S)
+        elif self.currentState == State.VENTING_FORELINE:
+            self.dispatch_event(Event.TIMEOUT_5S)
+
+    def _dispatch_venting_atm_timeout(self):
+        if self.currentState == State.VENTING_ATM:
+            self.dispatch_event(Event.TIMEOUT_10S)
+    
+    def _poll_voltage_for_deenergizing(self):
+        if self.currentState == State.DEENERGIZING and self.send_command:
+            try:
+                self.send_command("READ_NODE_VOLTAGE:3")
+            except Exception as e:
+                logger.warning(f"Error polling voltage: {e}")
+            
+            if self._voltage_poll_timer:
+                self._voltage_poll_timer.cancel()
+            self._voltage_poll_timer = threading.Timer(0.5, self._poll_voltage_for_deenergizing)
+            self._voltage_poll_timer.start()
+
+    def _enter_state(self, new_state: State):
+        self._log(f"Entering state {new_state.name}")
+        self.currentState = new_state
+        self._apply_state(new_state)
+        hook = self._STATE_ENTRY_HOOKS.get(new_state)
+        if hook:
+            method, args = hook
+            method(self, *args)
+        if self.state_callback:
+            self.state_callback(new_state)
+
+    def _apply_state(self, state: State):
+        outputs = STATE_OUTPUTS[state - 1]
+        last = _UNKNOWN_OUTPUTS if state == State.ALL_OFF else self._last_outputs
+        if self.command_handler and self.send_command:
+            # Everything a transition changes goes to the target together
+            commands = []
+            for column, value, previous in zip(
+                self._state_commands[state - 1], outputs, last
+            ):
+                if value != previous:
+                    commands.extend(column)
+            self._send_commands(commands)
+        else:
+            volts = outputs[STATE_OUTPUT_VOLTS]
+            for actuator, value, previous in zip(
+                self._output_actuators, outputs, last
+            ):
+                if value != previous and actuator:
+                    actuator.setDigitalValue(value > 0)
+            if volts != last[STATE_OUTPUT_VOLTS] and self._power_supply:
+                self._power_supply.setAnalogValue(volts)
+        # Only outputs that differ from the previous state are sent. ALL_OFF
+        # hands control back to the manual panel, which may move anything, so
+        # it is always applied in full and the next state starts from scratch.
+        self._last_outputs = _UNKNOWN_OUTPUTS if state == State.ALL_OFF else outputs
+
+    def _start_voltage_poll(self):
+        if self._voltage_poll_timer:
+            self._voltage_poll_timer.cancel()
+        self._voltage_poll_timer = threading.Timer(0.5, self._poll_voltage_for_deenergizing)
+        self._voltage_poll_timer.start()
+
+    def _start_timeout(self, seconds: float):
+        if self._timeout_timer:
+            self._timeout_timer.cancel()
+        self._timeout_timer = threading.Timer(seconds, self._dispatch_timeout_event)
+        self._timeout_timer.start()
+
+    def _start_venting_atm_timeout(self):
+        if self._venting_atm_timer:
+            self._venting_atm_timer.cancel()
+        self._venting_atm_timer = threading.Timer(10.0, self._dispatch_venting_atm_timeout)
+        self._venting_atm_timer.start()
+
+    # Work beyond the output table that some states start on entry, as
+    # (method, args) so the table needs no per-instance binding
+    _STATE_ENTRY_HOOKS = MappingProxyType({
+        State.DEENERGIZING: (_start_voltage_poll, ()),
+        State.CLOSING_MAIN: (_start_timeout, (6.0,)),
+        State.VENTING_FORELINE: (_start_timeout, (5.0,)),
+        State.VENTING_ATM: (_start_venting_atm_timeout, ()),
+    })
+
+
+class TelemetryToEventMapper:
+    def __init__(self, controller: AutoController):
+        self.controller = controller
+        # Each state that reacts to telemetry has one guard returning the event
+        # to dispatch (or None), so a packet runs a single check, not all of them
+        self._guards = {
+            State.ROUGH_PUMP_DOWN: self._guard_rough_pump_down,
+            State.RP_DOWN_TURBO: self._guard_rp_down_turbo,
+            State.TURBO_PUMP_DOWN: self._guard_turbo_pump_down,
+            State.TP_DOWN_MAIN: self._guard_main_at_zero,
+            State.SETTLE_STEADY_PRESSURE: self._guard_settle_steady_pressure,
+            State.SETTLING_10KV: self._guard_main_at_zero,
+            State.DEENERGIZING: self._guard_deenergizing,
+        }
+
+    def handle_telemetry(self, telemetry: dict):
+        t = Telemetry(
+            telemetry.get("APS_location"),
+            telemetry.get("APS_pressure_Torr"),
+            telemetry.get("voltage_kV"),
+            telemetry.get("current_mA"),
+        )
+        s = self.controller.currentState
+
+        # Log telemetry data for debugging; checked first because this runs
+        # for every packet and debug is normally off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[FSM Telemetry] State: %s, Location: %s, Pressure: %s Torr, "
+                "Voltage: %s kV, Current: %s mA",
+                s.name,
+                t.aps_loc,
+                t.aps_p,
+                t.v_kv,
+                t.i_mA,
+            )
+
+        guard = self._guards.get(s)
+        if guard is None:
+            return
+        event = guard(t)
+        if event is not None:
+            self.controller.dispatch_event(event)
+
+    @staticmethod
+    def _guard_rough_pump_down(t: Telemetry):
+        if t.aps_loc == APS_FORELINE and t.aps_p is not None:
+            if t.aps_p <= 300.0:
+                logger.info(
+                    "[FSM] ROUGH_PUMP_DOWN: Pressure %s Torr <= 300.0 Torr, "
+                    "dispatching APS_FORELINE_LT_100MT",
+                    t.aps_p,
+                )
+                return Event.APS_FORELINE_LT_100MT
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[FSM] ROUGH_PUMP_DOWN: Pressure %s Torr > 300.0 Torr, "
+                    "waiting...",
+                    t.aps_p,
+                )
+        return None
+
+    @staticmethod
+    def _guard_rp_down_turbo(t: Telemetry):
+        if t.aps_loc == APS_TURBO and t.aps_p is not None and t.aps_p <= 300.0:
+            return Event.APS_TURBO_LT_100MT
+        return None
+
+    @staticmethod
+    def _guard_turbo_pump_down(t: Telemetry):
+        if t.aps_loc == APS_TURBO and t.aps_p is not None and t.aps_p <= 100.0:
+            return Event.APS_TURBO_LT_0_1MT
+        return None
+
+    @staticmethod
+    def _guard_main_at_zero(t: Telemetry):
+        if t.aps_loc == APS_MAIN and t.aps_p is not None and abs(t.aps_p) < 0.0001:
+            return Event.CMF_EQ_0
+        return None
+
+    @staticmethod
+    def _guard_settle_steady_pressure(t: Telemetry):
+        if t.aps_loc == APS_MAIN and t.aps_p is not None:
+            if 49.5 <= t.aps_p * 1000.0 <= 50.5:
+                return Event.CMF_EQ_50
+        return None
+
+    def _guard_deenergizing(self, t: Telemetry):
+        v_kv = t.v_kv
+        if v_kv is None:
+            v_kv = self.controller._last_voltage_kv
+        if v_kv is not None and abs(v_kv) < 0.1:
+            return Event.ZERO_KV_STEADY
+        return None
@@ -1,9 +1,24 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 from base_classes import CommandBuilderInterface
 
 logger = logging.getLogger("CommandHandler")
 
+BATCH_SEPARATOR = ";"
+
+
+def _parse_percent(value, what: str) -> Optional[int]:
+    # Shared by every 0-100 command: cast once, then one chained range check
+    try:
+        value = int(value)
+    except (ValueError, TypeError):
+        logger.error(f"Invalid {what} type: {type(value)}")
+        return None
+    if not 0 <= value <= 100:
+        logger.warning(f"{what.capitalize()} out of range: {value} (expected 0-100)")
+        return None
+    return value
+
 
 class CommandHandler(CommandBuilderInterface):
 
@@ -31,14 +46,8 @@ class CommandHandler(CommandBuilderInterface):
 
     @staticmethod
     def build_set_pump_power_command(power: int) -> Optional[str]:
-        try:
-            power = int(power)
-        except (ValueError, TypeError):
-            logger.error(f"Invalid power type: {type(power)}")
-            return None
-
-        if power < 0 or power > 100:
-            logger.warning(f"Power out of range: {power} (expected 0-100)")
+        power = _parse_percent(power, "power")
+        if power is None:
             return None
 
         return f"SET_PUMP_POWER:{power}"
@@ -65,45 +74,49 @@ class CommandHandler(CommandBuilderInterface):
     def build_set_valve_command(valve_id: int, position: int) -> Optional[str]:
         try:
             valve_id = int(valve_id)
-            position = int(position)
         except (ValueError, TypeError):
             logger.error(f"Invalid valve_id or position type")
             return None
 
-        if valve_id < 1 or valve_id > 6:
+        if not 1 <= valve_id <= 6:
             logger.warning(f"Valve ID out of range: {valve_id} (expected 1-6)")
             return None
 
-        if position < 0 or position > 100:
-            logger.warning(f"Valve position out of range: {position} (expected 0-100)")
+        position = _parse_percent(position, "valve position")
+        if position is None:
             return None
 
         return f"SET_VALVE{valve_id}:{position}"
 
     @staticmethod
     def build_set_mechanical_pump_command(power: int) -> Optional[str]:
-        try:
-            power = int(power)
-        except (ValueError, TypeError):
-            logger.error(f"Invalid power type: {type(power)}")
-            return None
-
-        if power < 0 or power > 100:
-            logger.warning(f"Power out of range: {power} (expected 0-100)")
+        power = _parse_percent(power, "power")
+        if power is None:
             return None
 
         return f"SET_MECHANICAL_PUMP:{power}"
 
     @staticmethod
     def build_set_turbo_pump_command(power: int) -> Optional[str]:
-        try:
-            power = int(power)
-        except (ValueError, TypeError):
-            logger.error(f"Invalid power type: {type(power)}")
+        power = _parse_percent(power, "power")
+        if power is None:
+            return None
+
+        return f"SET_TURBO_PUMP:{power}"
+
+    @staticmethod
+    def build_batch_command(commands: List[str]) -> Optional[str]:
+        commands = [cmd.strip() for cmd in commands if cmd and cmd.strip()]
+        if not commands:
+            logger.warning("Batch command requested with no commands")
+            return None
+
+        if any(BATCH_SEPARATOR in cmd for cmd in commands):
+            logger.error(f"Batch commands may not contain '{BATCH_SEPARATOR}'")
             return None
 
-        if power < 0 or power > 100:
-            logger.warning(f"Power out of range: {power} (expected 0-100)")
+        if any(cmd.upper().startswith("BATCH:") for cmd in commands):
+            logger.error("Batch commands may not be nested")
             return None
 
-        return f"SET_TURBO_PUMP:{power}"
\ No newline at end of file
+        return "BATCH:" + BATCH_SEPARATOR.join(commands)
@@ -6,6 +6,14 @@
 
 import time
 import threading
+import heapq
+import itertools
+import logging
+
+logger = logging.getLogger("ControlSystem")
+
+# How often ControlSystemManager re-evaluates interlocks (seconds)
+INTERLOCK_PERIOD = 0.01
 
 
 # ==========================================================
@@ -42,10 +50,15 @@ class Actuator:
         self.component = component
         self.min_val = min_val
         self.max_val = max_val
+        # Bound once; write() runs on every PID sample
+        self._set_value = component.setAnalogValue
 
     def write(self, value):
-        value = max(self.min_val, min(self.max_val, value))
-        self.component.setAnalogValue(value)
+        min_val = self.min_val
+        max_val = self.max_val
+        self._set_value(
+            min_val if value < min_val else max_val if value > max_val else value
+        )
 
 
 class VariacActuator(Actuator):
@@ -54,12 +67,15 @@ class VariacActuator(Actuator):
     using the SET_VARIAC:<raw> command.
     Range: 0–28000 (1 V per unit)
     """
+    COMMAND_PREFIX = "SET_VARIAC:"
+
     def __init__(self, component):
         super().__init__("variac", component, 0, 28000)
+        self._send = component._send_target_command
 
     def write(self, value):
-        raw = int(max(0, min(28000, value)))
-        self.component._send_target_command(f"SET_VARIAC:{raw}")
+        raw = int(0 if value < 0 else 28000 if value > 28000 else value)
+        self._send(self.COMMAND_PREFIX + str(raw))
 
 
 # ==========================================================
@@ -67,7 +83,8 @@ class VariacActuator(Actuator):
 # ==========================================================
 class PID:
     """
-    Fully generic PID controller running in its own thread.
+    Fully generic PID controller. Runs in its own thread when enabled
+    directly, or on the ControlSystemManager thread via enable_pid().
     """
     def __init__(self, name, sensor: Sensor, actuator: Actuator,
                  kp, ki, kd,
@@ -90,56 +107,68 @@ class PID:
 
         self.integral = 0.0
         self.prev_error = 0.0
-        self.prev_time = time.time()
+        self.prev_time = time.monotonic()
 
         self.enabled = False
         self.thread = None
+        self._stop = threading.Event()
 
     def enable(self):
         if not self.enabled:
             self.enabled = True
-            self.thread = threading.Thread(target=self._loop, daemon=True)
+            # Fresh event per run so a loop still winding down from an earlier
+            # disable() can't be revived by this enable()
+            self._stop = threading.Event()
+            self.thread = threading.Thread(
+                target=self._loop, args=(self._stop,), daemon=True
+            )
             self.thread.start()
 
     def disable(self):
         self.enabled = False
+        self._stop.set()
 
     def set_setpoint(self, value):
         self.setpoint = float(value)
         self.integral = 0
         self.prev_error = 0
 
-    def _loop(self):
-        while self.enabled:
-            now = time.time()
-            dt = now - self.prev_time
-            if dt < self.sample_time:
-                time.sleep(0.001)
-                continue
-            self.prev_time = now
+    def _step(self, measurement, dt):
+        error = self.setpoint - measurement
 
-            measurement = self.sensor.read()
-            error = self.setpoint - measurement
+        # PID terms
+        self.integral += error * dt
+        derivative = (error - self.prev_error) / dt if dt > 0 else 0
 
-            # PID terms
-            self.integral += error * dt
-            derivative = (error - self.prev_error) / dt if dt > 0 else 0
+        output = (
+            self.kp * error +
+            self.ki * self.integral +
+            self.kd * derivative
+        )
 
-            output = (
-                self.kp * error +
-                self.ki * self.integral +
-                self.kd * derivative
-            )
+        self.prev_error = error
 
-            # clamp output
-            output = max(self.out_min, min(self.out_max, output))
+        # clamp output
+        out_min = self.out_min
+        out_max = self.out_max
+        return out_min if output < out_min else out_max if output > out_max else output
 
-            self.prev_error = error
+    def _tick(self, now):
+        dt = now - self.prev_time
+        self.prev_time = now
 
-            # Apply actuator
-            self.actuator.write(output)
+        # Apply actuator
+        self.actuator.write(self._step(self.sensor.read(), dt))
 
-            time.sleep(0.001)
+    def _loop(self, stop):
+        while not stop.is_set():
+            now = time.monotonic()
+            dt = now - self.prev_time
+            if dt < self.sample_time:
+                # Sleep straight to the next sample; disable() wakes it early
+                stop.wait(self.sample_time - dt)
+                continue
+            self._tick(now)
 
 
 # ==========================================================
@@ -179,64 +208,83 @@ class SplitRangePID:
 
         self.hysteresis = hysteresis
         self.mode = "FAST"  # FAST or SLOW
+        self._update_mode_thresholds()
 
         self.integral = 0
         self.prev_error = 0
-        self.prev_time = time.time()
+        self.prev_time = time.monotonic()
 
         self.enabled = False
         self.thread = None
+        self._stop = threading.Event()
 
     def enable(self):
         if not self.enabled:
             self.enabled = True
-            self.thread = threading.Thread(target=self._loop, daemon=True)
+            # Fresh event per run so a loop still winding down from an earlier
+            # disable() can't be revived by this enable()
+            self._stop = threading.Event()
+            self.thread = threading.Thread(
+                target=self._loop, args=(self._stop,), daemon=True
+            )
             self.thread.start()
 
     def disable(self):
         self.enabled = False
+        self._stop.set()
 
     def set_setpoint(self, value):
         self.setpoint = float(value)
         self.integral = 0
         self.prev_error = 0
-
-    def _loop(self):
-        while self.enabled:
-            now = time.time()
+        self._update_mode_thresholds()
+
+    def _update_mode_thresholds(self):
+        # Error bands for switching between the fast and slow actuator only
+        # change with the setpoint, so work them out here, not every sample
+        self._slow_threshold = self.setpoint * self.hysteresis
+        self._fast_threshold = self.setpoint * (self.hysteresis * 2)
+
+    def _step(self, measurement, dt):
+        error = self.setpoint - measurement
+
+        # PID terms
+        self.integral += error * dt
+        deriv = (error - self.prev_error) / dt if dt > 0 else 0
+        pid_out = self.kp * error + self.ki * self.integral + self.kd * deriv
+        self.prev_error = error
+
+        # Mode switching
+        if self.mode == "FAST":
+            if abs(error) < self._slow_threshold:
+                self.mode = "SLOW"
+        else:
+            if abs(error) > self._fast_threshold:
+                self.mode = "FAST"
+
+        if self.mode == "FAST":
+            low, high, actuator = self.fast_min, self.fast_max, self.fast
+        else:
+            low, high, actuator = self.slow_min, self.slow_max, self.slow
+        return actuator, low if pid_out < low else high if pid_out > high else pid_out
+
+    def _tick(self, now):
+        dt = now - self.prev_time
+        self.prev_time = now
+
+        # Apply output
+        actuator, out = self._step(self.sensor.read(), dt)
+        actuator.write(out)
+
+    def _loop(self, stop):
+        while not stop.is_set():
+            now = time.monotonic()
             dt = now - self.prev_time
             if dt < self.sample_time:
-                time.sleep(0.001)
+                # Sleep straight to the next sample; disable() wakes it early
+                stop.wait(self.sample_time - dt)
                 continue
-
-            self.prev_time = now
-
-            measurement = self.sensor.read()
-            error = self.setpoint - measurement
-
-            # PID terms
-            self.integral += error * dt
-            deriv = (error - self.prev_error) / dt if dt > 0 else 0
-            pid_out = self.kp * error + self.ki * self.integral + self.kd * deriv
-            self.prev_error = error
-
-            # Mode switching
-            if self.mode == "FAST":
-                if abs(error) < self.setpoint * self.hysteresis:
-                    self.mode = "SLOW"
-            else:
-                if abs(error) > self.setpoint * (self.hysteresis * 2):
-                    self.mode = "FAST"
-
-            # Apply output
-            if self.mode == "FAST":
-                out = max(self.fast_min, min(self.fast_max, pid_out))
-                self.fast.write(out)
-            else:
-                out = max(self.slow_min, min(self.slow_max, pid_out))
-                self.slow.write(out)
-
-            time.sleep(0.001)
+            self._tick(now)
 
 
 # ==========================================================
@@ -268,7 +316,8 @@ class InterlockManager:
 class ControlSystemManager:
     """
     Holds all sensors, actuators, PIDs, and interlocks.
-    Runs interlock evaluation continuously.
+    Runs interlock evaluation continuously, and steps every enabled PID
+    from the same thread instead of one thread per loop.
     """
 
     def __init__(self):
@@ -277,7 +326,15 @@ class ControlSystemManager:
         self.pids = {}
         self.interlocks = InterlockManager()
 
-        self.enabled = True
+        # Heap of (next_due, seq, key, generation); an entry whose generation
+        # no longer matches _pid_generations[key] is stale and dropped
+        self._schedule = []
+        self._schedule_seq = itertools.count()
+        self._pid_generations = {}
+        self._schedule_lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+        self._stop = threading.Event()
         self.thread = threading.Thread(target=self._loop, daemon=True)
         self.thread.start()
 
@@ -292,14 +349,97 @@ class ControlSystemManager:
         self.pids[key] = pid
 
     def enable_pid(self, key):
-        if key in self.pids:
-            self.pids[key].enable()
+        pid = self.pids.get(key)
+        if pid is None or pid.enabled:
+            return
+        pid.enabled = True
+        with self._schedule_lock:
+            generation = self._pid_generations.get(key, 0) + 1
+            self._pid_generations[key] = generation
+            heapq.heappush(
+                self._schedule,
+                (
+                    time.monotonic() + pid.sample_time,
+                    next(self._schedule_seq),
+                    key,
+                    generation,
+                ),
+            )
+        self._wakeup.set()
 
     def disable_pid(self, key):
         if key in self.pids:
             self.pids[key].disable()
+            with self._schedule_lock:
+                self._pid_generations[key] = self._pid_generations.get(key, 0) + 1
+
+    @property
+    def enabled(self):
+        return not self._stop.is_set()
+
+    @enabled.setter
+    def enabled(self, value):
+        # Kept assignable for callers that stop the manager with
+        # "manager.enabled = False"; the loop itself waits on _stop
+        if value:
+            if self._stop.is_set():
+                raise RuntimeError("ControlSystemManager cannot be restarted")
+            return
+        self.disable()
+
+    def disable(self):
+        self._stop.set()
+        self._wakeup.set()
+
+    def _pop_due_pids(self, now):
+        due = []
+        with self._schedule_lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                next_due, _seq, key, generation = heapq.heappop(self._schedule)
+                # pid.disable() called directly only clears pid.enabled, so
+                # treat that the same as disable_pid() and drop the entry
+                if (
+                    self._pid_generations.get(key) == generation
+                    and self.pids[key].enabled
+                ):
+                    due.append((next_due, key, generation))
+        return due
+
+    def _reschedule(self, key, generation, next_due):
+        with self._schedule_lock:
+            if self._pid_generations.get(key) == generation:
+                heapq.heappush(
+                    self._schedule,
+                    (next_due, next(self._schedule_seq), key, generation),
+                )
 
     def _loop(self):
-        while self.enabled:
-            self.interlocks.evaluate()
-            time.sleep(0.01)
+        next_interlock = time.monotonic()
+        while not self._stop.is_set():
+            now = time.monotonic()
+            if now >= next_interlock:
+                self.interlocks.evaluate()
+                next_interlock = now + INTERLOCK_PERIOD
+
+            for due, key, generation in self._pop_due_pids(now):
+                pid = self.pids[key]
+                if not pid.enabled:
+                    # Disabled since it was popped
+                    continue
+                try:
+                    pid._tick(time.monotonic())
+                except Exception as e:
+                    logger.error("PID %s step failed: %s", pid.name, e)
+                # Keep a steady cadence, but don't burst to catch up after a
+                # stall
+                next_due = due + pid.sample_time
+                if next_due <= now:
+                    next_due = now + pid.sample_time
+                self._reschedule(key, generation, next_due)
+
+            with self._schedule_lock:
+                wake_at = next_interlock
+                if self._schedule and self._schedule[0][0] < wake_at:
+                    wake_at = self._schedule[0][0]
+            self._wakeup.wait(max(0.0, wake_at - time.monotonic()))
+            self._wakeup.clear()
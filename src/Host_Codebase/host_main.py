@@ -6,882 +6,107 @@ import logging
 import signal
 import sys
 import atexit
+import functools
 import json
 import threading
-from enum import Enum, auto
-from queue import Queue
+from collections import deque
+from queue import Queue, Empty
 from tcp_command_client import TCPCommandClient
 from udp_data_client import UDPDataClient
 from udp_status_client import UDPStatusClient, UDPStatusReceiver
-from command_handler import CommandHandler
+from command_handler import CommandHandler, BATCH_SEPARATOR
 from actuator_object import ActuatorObject
 from sensor_object import SensorObject
 from tcp_client_object import TCPClientObject
 from udp_client_object import UDPClientObject
-import sys
-import os
-import importlib.util
-target_codebase_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Target_Codebase'))
-target_base_classes_path = os.path.join(target_codebase_path, 'base_classes.py')
-spec = importlib.util.spec_from_file_location("target_base_classes", target_base_classes_path)
-target_base_classes = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(target_base_classes)
-ADCInterface = target_base_classes.ADCInterface
+from auto_controller import (
+    State,
+    Event,
+    RemoteADC,
+    AutoController,
+    TelemetryToEventMapper,
+    APS_FORELINE,
+    APS_TURBO,
+    APS_MAIN,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("HostMain")
 
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("blue")
-
-
-def _build_actuator_command(actuator_name: str, value: float) -> str:
-    if "valve" in actuator_name.lower():
-        if "atm" in actuator_name.lower() or "depressure" in actuator_name.lower():
-            return f"SET_VALVE1:{int(value)}"
-        elif "foreline" in actuator_name.lower():
-            return f"SET_VALVE2:{int(value)}"
-        elif "vacuum" in actuator_name.lower() or "system" in actuator_name.lower():
-            return f"SET_VALVE3:{int(value)}"
-        elif "deuterium" in actuator_name.lower() or "supply" in actuator_name.lower():
-            return f"SET_VALVE4:{int(value)}"
-    elif "power" in actuator_name.lower() or "supply" in actuator_name.lower():
-        return f"SET_VOLTAGE:{int(value)}"
-    elif "pump" in actuator_name.lower():
-        if "mechanical" in actuator_name.lower() or "roughing" in actuator_name.lower():
-            return f"SET_MECHANICAL_PUMP:{int(value)}"
-        elif "turbo" in actuator_name.lower():
-            return f"SET_TURBO_PUMP:{int(value)}"
+# GUI update polling (ms): fast while updates arrive, backing off when idle
+GUI_POLL_BUSY_MS = 20
+GUI_POLL_ACTIVE_MS = 50
+GUI_POLL_IDLE_MAX_MS = 200
+GUI_POLL_BUSY_BATCH = 16
+
+# Outputs zeroed by the emergency stop, supply first
+EMERGENCY_STOP_ACTUATORS = (
+    "power_supply",
+    "mech_pump",
+    "turbo_pump",
+    "atm_valve",
+    "foreline_valve",
+    "fusor_valve",
+    "deuterium_valve",
+)
+
+# Repeated clicks on the same Set button within this window send only once
+CLICK_DEBOUNCE_MS = 50
+
+# Lines kept in each scrolling log textbox
+LOG_DISPLAY_MAX_LINES = 1000
+
+# Telemetry keys, built once rather than re-formatted for every packet
+ADC_CHANNEL_KEYS = tuple(f"ADC_CH{channel}" for channel in range(8))
+ADC_DATA_MARKERS = tuple(
+    key + separator
+    for key in ADC_CHANNEL_KEYS + ("ADC_DATA",)
+    for separator in (":", "=")
+)
+PRESSURE_VALUE_KEYS = tuple(
+    f"PRESSURE_SENSOR_{sensor_id}_VALUE" for sensor_id in range(1, 4)
+)
+PRESSURE_READOUT_CAPTIONS = {
+    1: "TC Gauge 1 [ADC CH0]",
+    2: "TC Gauge 2 [ADC CH1]",
+    3: "Manometer 1 [ADC CH2]",
+}
+PRESSURE_DISPLAY_IDS = {
+    "pressure_sensor_1": 1,
+    "pressure_sensor_2": 2,
+    "pressure_sensor_3": 3,
+}
+
+# Slider readouts for 0-100% controls, built once instead of on every drag event
+_PERCENT_LABELS = tuple(f"{percent}%" for percent in range(101))
+
+
+@functools.lru_cache(maxsize=64)
+def _actuator_command_prefix(actuator_name: str) -> str:
+    # Actuator names are fixed, so the keyword matching runs once per name
+    name = actuator_name.lower()
+    if "valve" in name:
+        if "atm" in name or "depressure" in name:
+            return "SET_VALVE1:"
+        elif "foreline" in name:
+            return "SET_VALVE2:"
+        elif "vacuum" in name or "system" in name:
+            return "SET_VALVE3:"
+        elif "deuterium" in name or "supply" in name:
+            return "SET_VALVE4:"
+    elif "power" in name or "supply" in name:
+        return "SET_VOLTAGE:"
+    elif "pump" in name:
+        if "mechanical" in name or "roughing" in name:
+            return "SET_MECHANICAL_PUMP:"
+        elif "turbo" in name:
+            return "SET_TURBO_PUMP:"
     return ""
 
 
-class State(Enum):
-    ALL_OFF = auto()
-    ROUGH_PUMP_DOWN = auto()
-    RP_DOWN_TURBO = auto()
-    TURBO_PUMP_DOWN = auto()
-    TP_DOWN_MAIN = auto()
-    SETTLE_STEADY_PRESSURE = auto()
-    SETTLING_10KV = auto()
-    NOMINAL_27KV = auto()
-    DEENERGIZING = auto()
-    CLOSING_MAIN = auto()
-    VENTING_FORELINE = auto()
-    VENTING_ATM = auto()
-
-
-class Event(Enum):
-    START = auto()
-    APS_FORELINE_LT_100MT = auto()
-    APS_TURBO_LT_100MT = auto()
-    APS_TURBO_LT_0_1MT = auto()
-    APS_MAIN_LT_0_1MT = auto()
-    APS_MAIN_EQ_0_1_STEADY = auto()
-    STEADY_STATE_VOLTAGE = auto()
-    STEADY_STATE_CURRENT = auto()
-    CMF_EQ_0 = auto()
-    CMF_EQ_50 = auto()
-    STOP_CMD = auto()
-    ZERO_KV_STEADY = auto()
-    TIMEOUT_5S = auto()
-    TIMEOUT_6S = auto()
-    TIMEOUT_10S = auto()
-    APS_EQ_1_ATM = auto()
-    FAULT_FORELINE_TURBO = auto()
-    FAULT_MAIN_TURBO = auto()
-
-
-class RemoteADC(ADCInterface):
-    
-    def __init__(self, tcp_client, command_handler):
-        super().__init__(spi_port=0, spi_device=0)
-        self.tcp_client = tcp_client
-        self.command_handler = command_handler
-        self._is_initialized = True
-        self._cache = [None] * 8
-        self._cache_lock = threading.Lock()
-    
-    def initialize(self) -> bool:
-
-        self._is_initialized = True
-        return True
-    
-    def read_channel(self, channel: int) -> int:
-        if not self.validate_channel(channel):
-            return None
-        
-        with self._cache_lock:
-            cached = self._cache[channel]
-            if cached is not None and not isinstance(cached, str):
-                return cached
-        
-        try:
-            if self.tcp_client and self.tcp_client.is_connected():
-                command = f"READ_ADC_CHANNEL:{channel}"
-                response = self.tcp_client.send_command(command)
-                
-                if response:
-                    parts = response.split("|")
-                    for part in parts:
-                        if f"ADC_CH{channel}:" in part:
-                            try:
-                                value_str = part.split(":")[1].strip()
-                                if value_str.upper() in ["FLOATING", "UNUSED"]:
-                                    return None
-                                value = int(value_str)
-                                with self._cache_lock:
-                                    self._cache[channel] = value
-                                return value
-                            except (ValueError, IndexError):
-                                pass
-        except Exception as e:
-            logger.warning(f"Error reading ADC channel {channel} from target: {e}")
-        
-        return None
-    
-    def read_all_channels(self) -> list:
-        """Read all ADC channels from target."""
-        try:
-            if self.tcp_client and self.tcp_client.is_connected():
-                command = "READ_ACTIVE_ADC_CHANNELS"
-                response = self.tcp_client.send_command(command)
-                
-                if response:
-                    values = [None] * 8
-                    parts = response.split("|")
-                    
-                    for part in parts:
-                        if "ADC_DATA:" in part:
-                            try:
-                                data_str = part.split(":")[1].strip()
-                                data_list = [x.strip() for x in data_str.split(",")]
-                                for i, val in enumerate(data_list[:8]):
-                                    if val.upper() in ["FLOATING", "UNUSED"]:
-                                        values[i] = None
-                                    else:
-                                        try:
-                                            values[i] = int(val)
-                                        except ValueError:
-                                            values[i] = None
-                                with self._cache_lock:
-                                    self._cache = values.copy()
-                                return values
-                            except (ValueError, IndexError):
-                                pass
-                    
-                    for ch in range(8):
-                        for part in parts:
-                            if f"ADC_CH{ch}:" in part:
-                                try:
-                                    value_str = part.split(":")[1].strip()
-                                    if value_str.upper() in ["FLOATING", "UNUSED"]:
-                                        values[ch] = None
-                                    else:
-                                        values[ch] = int(value_str)
-                                except (ValueError, IndexError):
-                                    pass
-                    
-                    with self._cache_lock:
-                        self._cache = values.copy()
-                    return values
-        except Exception as e:
-            logger.warning(f"Error reading all ADC channels from target: {e}")
-        
-        return [None] * 8
-    
-    def cleanup(self):
-        """No cleanup needed for remote ADC."""
-        pass
-    
-    def update_cache(self, channel: int, value):
-        if 0 <= channel < 8:
-            with self._cache_lock:
-                if isinstance(value, str):
-                    if value.upper() in ["FLOATING", "UNUSED", "---"]:
-                        self._cache[channel] = None
-                    else:
-                        try:
-                            self._cache[channel] = int(value)
-                        except ValueError:
-                            self._cache[channel] = None
-                else:
-                    self._cache[channel] = value
-
-
-class AutoController:
-    def __init__(
-        self,
-        actuators: dict,
-        sensors: dict = None,
-        state_callback=None,
-        log_callback=None,
-        command_handler=None,
-        send_command_callback=None,
-        tcp_client=None,
-    ):
-        self.actuators = actuators
-        self.sensors = sensors or {}
-        self.currentState = State.ALL_OFF
-        self.state_callback = state_callback
-        self.log_callback = log_callback
-        self.command_handler = command_handler
-        self.send_command = send_command_callback
-        self._timeout_timer = None
-        self._venting_atm_timer = None
-        self._voltage_poll_timer = None
-        self._last_voltage_kv = None
-        
-        self.adc = RemoteADC(tcp_client, command_handler) if tcp_client else None
-
-        self.FSM = {
-            (State.ALL_OFF, Event.START): State.ROUGH_PUMP_DOWN,
-            (State.ROUGH_PUMP_DOWN, Event.APS_FORELINE_LT_100MT): State.RP_DOWN_TURBO,
-            (State.RP_DOWN_TURBO, Event.APS_TURBO_LT_100MT): State.TURBO_PUMP_DOWN,
-            (State.RP_DOWN_TURBO, Event.FAULT_FORELINE_TURBO): State.ALL_OFF,
-            (State.TURBO_PUMP_DOWN, Event.APS_TURBO_LT_0_1MT): State.TP_DOWN_MAIN,
-            (State.TP_DOWN_MAIN, Event.CMF_EQ_0): State.SETTLE_STEADY_PRESSURE,
-            (State.TP_DOWN_MAIN, Event.FAULT_MAIN_TURBO): State.ALL_OFF,
-            (
-                State.SETTLE_STEADY_PRESSURE,
-                Event.CMF_EQ_50,
-            ): State.SETTLING_10KV,
-            (State.SETTLING_10KV, Event.CMF_EQ_0): State.NOMINAL_27KV,
-            (State.DEENERGIZING, Event.ZERO_KV_STEADY): State.CLOSING_MAIN,
-            (State.CLOSING_MAIN, Event.TIMEOUT_6S): State.VENTING_FORELINE,
-            (State.VENTING_FORELINE, Event.TIMEOUT_5S): State.VENTING_ATM,
-            (State.VENTING_ATM, Event.TIMEOUT_10S): State.ALL_OFF,
-            # Emergency stop from any state - immediately go to ALL_OFF
-            (State.ROUGH_PUMP_DOWN, Event.STOP_CMD): State.ALL_OFF,
-            (State.RP_DOWN_TURBO, Event.STOP_CMD): State.ALL_OFF,
-            (State.TURBO_PUMP_DOWN, Event.STOP_CMD): State.ALL_OFF,
-            (State.TP_DOWN_MAIN, Event.STOP_CMD): State.ALL_OFF,
-            (State.SETTLE_STEADY_PRESSURE, Event.STOP_CMD): State.ALL_OFF,
-            (State.SETTLING_10KV, Event.STOP_CMD): State.ALL_OFF,
-            (State.NOMINAL_27KV, Event.STOP_CMD): State.DEENERGIZING,
-            (State.DEENERGIZING, Event.STOP_CMD): State.ALL_OFF,
-            (State.CLOSING_MAIN, Event.STOP_CMD): State.ALL_OFF,
-            (State.VENTING_FORELINE, Event.STOP_CMD): State.ALL_OFF,
-            (State.VENTING_ATM, Event.STOP_CMD): State.ALL_OFF,
-        }
-
-        self._state_entry_actions = {
-            State.ALL_OFF: self._enter_all_off,
-            State.ROUGH_PUMP_DOWN: self._enter_rough_pump_down,
-            State.RP_DOWN_TURBO: self._enter_rp_down_turbo,
-            State.TURBO_PUMP_DOWN: self._enter_turbo_pump_down,
-            State.TP_DOWN_MAIN: self._enter_tp_down_main,
-            State.SETTLE_STEADY_PRESSURE: self._enter_settle_steady_pressure,
-            State.SETTLING_10KV: self._enter_settling_10kv,
-            State.NOMINAL_27KV: self._enter_nominal_27kv,
-            State.DEENERGIZING: self._enter_deenergizing,
-            State.CLOSING_MAIN: self._enter_closing_main,
-            State.VENTING_FORELINE: self._enter_venting_foreline,
-            State.VENTING_ATM: self._enter_venting_atm,
-        }
-
-        self._enter_state(State.ALL_OFF)
-
-    def _log(self, message):
-        if self.log_callback:
-            self.log_callback(message)
-        logger.info(message)
-
-    def update_adc_values(self, adc_data: list):
-        if self.adc:
-            for i, value in enumerate(adc_data[:8]):
-                if value is not None and value != "---":
-                    self.adc.update_cache(i, value)
-
-    def _set_voltage_kv(self, kv: float):
-        if self.command_handler and self.send_command:
-            voltage = int(kv * 1000.0)
-            command = self.command_handler.build_set_voltage_command(voltage)
-            if command:
-                self.send_command(command)
-                if kv > 0:
-                    self.send_command("POWER_SUPPLY_ENABLE")
-                else:
-                    self.send_command("POWER_SUPPLY_DISABLE")
-        elif "power_supply" in self.actuators:
-            self.actuators["power_supply"].setAnalogValue(kv * 1000.0)
-
-    def dispatch_event(self, event: Event):
-        logger.debug(f"[FSM] dispatch_event called: {event.name} from state {self.currentState.name}")
-        if event == Event.STOP_CMD:
-            if self._timeout_timer:
-                self._timeout_timer.cancel()
-                self._timeout_timer = None
-            if self._venting_atm_timer:
-                self._venting_atm_timer.cancel()
-                self._venting_atm_timer = None
-            if self._voltage_poll_timer:
-                self._voltage_poll_timer.cancel()
-                self._voltage_poll_timer = None
-            
-            key = (self.currentState, event)
-            next_state = self.FSM.get(key)
-            if next_state is not None:
-                self._enter_state(next_state)
-            else:
-                self._enter_state(State.ALL_OFF)
-            return
-        
-        key = (self.currentState, event)
-        next_state = self.FSM.get(key)
-        if next_state is None:
-            self._log(f"No transition for {event.name} in {self.currentState.name}")
-            logger.warning(f"[FSM] No transition defined for ({self.currentState.name}, {event.name})")
-            return
-        logger.info(f"[FSM] Transitioning from {self.currentState.name} to {next_state.name} on event {event.name}")
-        self._enter_state(next_state)
-
-    def _dispatch_timeout_event(self):
-        if self.currentState == State.CLOSING_MAIN:
-            self.dispatch_event(Event.TIMEOUT_6S)
-        elif self.currentState == State.VENTING_FORELINE:
-            self.dispatch_event(Event.TIMEOUT_5S)
-
-    def _dispatch_venting_atm_timeout(self):
-        if self.currentState == State.VENTING_ATM:
-            self.dispatch_event(Event.TIMEOUT_10S)
-    
-    def _poll_voltage_for_deenergizing(self):
-        if self.currentState == State.DEENERGIZING and self.send_command:
-            try:
-                self.send_command("READ_NODE_VOLTAGE:3")
-            except Exception as e:
-                logger.warning(f"Error polling voltage: {e}")
-            
-            if self._voltage_poll_timer:
-                self._voltage_poll_timer.cancel()
-            self._voltage_poll_timer = threading.Timer(0.5, self._poll_voltage_for_deenergizing)
-            self._voltage_poll_timer.start()
-
-    def _enter_state(self, new_state: State):
-        self._log(f"Entering state {new_state.name}")
-        self.currentState = new_state
-        action = self._state_entry_actions.get(new_state)
-        if action:
-            action()
-        if self.state_callback:
-            self.state_callback(new_state)
-
-    def _enter_all_off(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(False)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(False)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(False)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(False)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-
-    def _enter_rough_pump_down(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(False)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(False)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-
-    def _enter_rp_down_turbo(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(False)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(False)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-
-    def _enter_turbo_pump_down(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(False)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-
-    def _enter_tp_down_main(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(True)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-            
-
-    def _enter_settle_steady_pressure(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 10)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 90)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(True)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(True)
-            self._set_voltage_kv(0)
-
-    def _enter_settling_10kv(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 10)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 90)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(10)
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(True)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(True)
-            self._set_voltage_kv(10)
-
-    def _enter_nominal_27kv(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 10)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 90)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(27)
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(True)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(True)
-            self._set_voltage_kv(27)
-
-    def _enter_deenergizing(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-            
-            if self._voltage_poll_timer:
-                self._voltage_poll_timer.cancel()
-            self._voltage_poll_timer = threading.Timer(0.5, self._poll_voltage_for_deenergizing)
-            self._voltage_poll_timer.start()
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(True)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-
-    def _enter_closing_main(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-            if self._timeout_timer:
-                self._timeout_timer.cancel()
-            self._timeout_timer = threading.Timer(6.0, self._dispatch_timeout_event)
-            self._timeout_timer.start()
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(False)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-
-    def _enter_venting_foreline(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-            if self._timeout_timer:
-                self._timeout_timer.cancel()
-            self._timeout_timer = threading.Timer(5.0, self._dispatch_timeout_event)
-            self._timeout_timer.start()
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(False)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-    
-    def _enter_venting_atm(self):
-        if self.command_handler and self.send_command:
-            cmd = self.command_handler.build_set_valve_command(1, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_mechanical_pump_command(100)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_turbo_pump_command(0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(2, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(3, 0)
-            if cmd:
-                self.send_command(cmd)
-            cmd = self.command_handler.build_set_valve_command(4, 0)
-            if cmd:
-                self.send_command(cmd)
-            self._set_voltage_kv(0)
-            if self._venting_atm_timer:
-                self._venting_atm_timer.cancel()
-            self._venting_atm_timer = threading.Timer(10.0, self._dispatch_venting_atm_timeout)
-            self._venting_atm_timer.start()
-        else:
-            a = self.actuators
-            if "atm_valve" in a:
-                a["atm_valve"].setDigitalValue(False)
-            if "mech_pump" in a:
-                a["mech_pump"].setDigitalValue(True)
-            if "turbo_pump" in a:
-                a["turbo_pump"].setDigitalValue(True)
-            if "foreline_valve" in a:
-                a["foreline_valve"].setDigitalValue(True)
-            if "fusor_valve" in a:
-                a["fusor_valve"].setDigitalValue(True)
-            if "deuterium_valve" in a:
-                a["deuterium_valve"].setDigitalValue(False)
-            self._set_voltage_kv(0)
-        
-
-class TelemetryToEventMapper:
-    def __init__(self, controller: AutoController):
-        self.controller = controller
-
-    def handle_telemetry(self, telemetry: dict):
-        aps_loc = telemetry.get("APS_location")
-        aps_p = telemetry.get("APS_pressure_Torr")
-        v_kv = telemetry.get("voltage_kV")
-        i_mA = telemetry.get("current_mA")
-        aps_atm_flag = telemetry.get("APS_atm_flag", False)
-        s = self.controller.currentState
-
-        # Log telemetry data for debugging
-        logger.debug(f"[FSM Telemetry] State: {s.name}, Location: {aps_loc}, Pressure: {aps_p} Torr, Voltage: {v_kv} kV, Current: {i_mA} mA")
-        
-        if s == State.ROUGH_PUMP_DOWN and aps_loc == "Foreline" and aps_p is not None:
-            logger.debug(f"[FSM] ROUGH_PUMP_DOWN: Checking pressure {aps_p} Torr <= 300.0 Torr")
-            if aps_p <= 300.0:
-                logger.info(f"[FSM] ROUGH_PUMP_DOWN: Pressure {aps_p} Torr <= 300.0 Torr, dispatching APS_FORELINE_LT_100MT")
-                self.controller.dispatch_event(Event.APS_FORELINE_LT_100MT)
-            else:
-                logger.debug(f"[FSM] ROUGH_PUMP_DOWN: Pressure {aps_p} Torr > 300.0 Torr, waiting...")
-
-        if s == State.RP_DOWN_TURBO and aps_loc == "Turbo" and aps_p is not None:
-            if aps_p <= 300.0:
-                self.controller.dispatch_event(Event.APS_TURBO_LT_100MT)
-
-        if s == State.TURBO_PUMP_DOWN and aps_loc == "Turbo" and aps_p is not None:
-            if aps_p <= 100.0:
-                self.controller.dispatch_event(Event.APS_TURBO_LT_0_1MT)
-
-        if s == State.TP_DOWN_MAIN and aps_loc == "Main" and aps_p is not None:
-            if abs(aps_p) < 0.0001:
-                self.controller.dispatch_event(Event.CMF_EQ_0)
-
-        if s == State.SETTLE_STEADY_PRESSURE and aps_loc == "Main" and aps_p is not None:
-            pressure_mtorr = aps_p * 1000.0
-            if 49.5 <= pressure_mtorr <= 50.5:
-                self.controller.dispatch_event(Event.CMF_EQ_50)
-
-        if s == State.SETTLING_10KV and aps_loc == "Main" and aps_p is not None:
-            if abs(aps_p) < 0.0001:
-                self.controller.dispatch_event(Event.CMF_EQ_0)
-
-        if s == State.DEENERGIZING:
-            if v_kv is not None:
-                if abs(v_kv) < 0.1:
-                    self.controller.dispatch_event(Event.ZERO_KV_STEADY)
-            elif self.controller._last_voltage_kv is not None:
-                if abs(self.controller._last_voltage_kv) < 0.1:
-                    self.controller.dispatch_event(Event.ZERO_KV_STEADY)
-
+def _build_actuator_command(actuator_name: str, value: float) -> str:
+    prefix = _actuator_command_prefix(actuator_name)
+    return prefix + str(int(value)) if prefix else ""
 
 
 class FusorHostApp:
@@ -918,14 +143,6 @@ class FusorHostApp:
         self.data_log_window = None
         self.data_reading_window = None
         self.target_logs_display = None
-        self.adc_ch0_label = None
-        self.adc_ch1_label = None
-        self.adc_ch2_label = None
-        self.adc_ch3_label = None
-        self.adc_ch4_label = None
-        self.adc_ch5_label = None
-        self.adc_ch6_label = None
-        self.adc_ch7_label = None
         self.status_label = None
         self.voltage_scale = None
         self.pump_power_scale = None
@@ -935,20 +152,43 @@ class FusorHostApp:
         self.turbo_pump_switch_state = False
         self.voltage_set_button = None
         self.valve_set_buttons = {}
+        self._slider_label_values = {}
+        self._pressure_display_values = {}
+        # StringVars behind the pressure readouts while the data window is open
+        self._pressure_vars = {}
+        # Last text pushed to each data-window readout label, keyed by Tk widget
+        # name; touched only on the Tk thread and cleared when the window goes
+        self._label_texts = {}
         self.pressure_label = None
-        self.adc_label = None
         self.auto_state_label = None
         self.auto_log_display = None
         self.terminal_updates_enabled = terminal_updates
         self._initial_log_message = None
+        # Log lines waiting for the next GUI poll, appended in one insert
+        self._data_display_pending = deque()
+        self._target_logs_pending = deque()
         
         self.previous_values = {}
 
         self._previous_values_lock = threading.Lock()
         self._actuators_lock = threading.Lock()
         self._sensors_lock = threading.Lock()
-        self._gui_update_queue = Queue()
+        # Appended from worker threads and drained only by the Tk loop;
+        # deque append/popleft are atomic, so no Queue lock per update
+        self._gui_update_queue = deque()
+        # Readout refreshes keyed by widget; only the newest one per key is
+        # drawn on each GUI tick
+        self._latest_gui_updates = {}
+        self._latest_gui_updates_lock = threading.Lock()
+        self._gui_poll_interval = GUI_POLL_ACTIVE_MS
         self._shutdown_event = threading.Event()
+        self._command_queue = Queue()
+        self._command_thread = None
+        # Set while the emergency stop drives the FSM, so its commands are
+        # sent before the zeroing batch instead of queued behind it
+        self._auto_sends_inline = False
+        # Pending after() ids for debounced Set buttons, keyed per control
+        self._debounce_ids = {}
 
         self.tcp_client_object = TCPClientObject(self.tcp_command_client)
         
@@ -1021,15 +261,18 @@ class FusorHostApp:
             state_callback=self._auto_update_state_label,
             log_callback=self._auto_log_event,
             command_handler=self.command_handler,
-            send_command_callback=self._send_command,
+            send_command_callback=self._submit_auto_command,
             tcp_client=self.tcp_command_client,
+            send_batch_callback=self._submit_auto_batch,
         )
         self.telemetry_mapper = TelemetryToEventMapper(self.auto_controller)
 
         self._setup_ui()
 
         if self.root:
-            self.root.update()
+            # Only flush pending geometry/redraw work so the window shows before
+            # the connect attempt; a full update() would also run queued events
+            # before the app has finished initialising
             self.root.update_idletasks()
 
         if not self.tcp_command_client.connect():
@@ -1059,6 +302,10 @@ class FusorHostApp:
         print("UDP status receiver started - waiting for status updates from target...")
 
     def _setup_ui(self):
+        # Applied here rather than at import so headless users of this module
+        # (tests, scripted runs) don't pay for loading the theme
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
         self.root = ctk.CTk()
         self.root.title("Farnsworth Fusor Control Panel")
         self.root.geometry("1100x800")
@@ -1124,7 +371,9 @@ class FusorHostApp:
         self.voltage_set_button = ctk.CTkButton(
             voltage_slider_frame,
             text="Set Voltage",
-            command=self._set_voltage,
+            command=functools.partial(
+                self._debounce_click, "voltage", self._set_voltage
+            ),
             font=ctk.CTkFont(size=11),
             width=100,
         )
@@ -1208,20 +457,25 @@ class FusorHostApp:
                 valve_frame,
                 from_=0,
                 to=100,
-                command=lambda v, k=actuator_key, idx=i: self._update_valve_label(
-                    k, idx, v
-                ),
+                command=functools.partial(self._update_valve_label, actuator_key, i),
             )
             slider.set(0)
             slider.pack(fill="x", padx=3, pady=3)
 
-            value_label = ctk.CTkLabel(valve_frame, text="0%", font=ctk.CTkFont(size=9))
+            value_label = ctk.CTkLabel(
+                valve_frame, text=_PERCENT_LABELS[0], font=ctk.CTkFont(size=9)
+            )
             value_label.pack()
 
             set_button = ctk.CTkButton(
                 valve_frame,
                 text="Set",
-                command=lambda k=actuator_key, s=slider: self._set_valve(k, s.get()),
+                command=functools.partial(
+                    self._debounce_click,
+                    actuator_key,
+                    self._set_valve_from_slider,
+                    actuator_key,
+                ),
                 font=ctk.CTkFont(size=9),
                 width=50,
                 height=25,
@@ -1272,16 +526,7 @@ class FusorHostApp:
         self.pressure_display1 = None
         self.pressure_display2 = None
         self.pressure_display3 = None
-        self.adc_ch0_label = None
-        self.adc_ch1_label = None
-        self.adc_ch2_label = None
-        self.adc_ch3_label = None
-        self.adc_ch4_label = None
-        self.adc_ch5_label = None
-        self.adc_ch6_label = None
-        self.adc_ch7_label = None
         self.pressure_label = None
-        self.adc_label = None
 
         log_reading_title = ctk.CTkLabel(
             log_reading_tab,
@@ -1386,268 +631,339 @@ class FusorHostApp:
 
         self._process_gui_updates()
 
+    def _command_worker(self):
+        # Manual controls hand their sends to this thread so the Tk loop never
+        # sits waiting on a target round trip
+        while not self._shutdown_event.is_set():
+            try:
+                func, args = self._command_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error("Error in command worker: %s", e)
+
+    def _submit_command(self, func, *args):
+        # Until the GUI loop is running there is nothing to keep responsive
+        if self._command_thread is None:
+            func(*args)
+            return
+        self._command_queue.put((func, args))
+
+    def _debounce_click(self, key, func, *args):
+        if not self.root:
+            func(*args)
+            return
+        pending = self._debounce_ids.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._debounce_ids[key] = self.root.after(
+            CLICK_DEBOUNCE_MS, self._run_debounced, key, func, args
+        )
+
+    def _run_debounced(self, key, func, args):
+        self._debounce_ids.pop(key, None)
+        func(*args)
+
+    def _submit_auto_command(self, command: str):
+        # State transitions run on the Tk thread, so the FSM's sends go through
+        # the same worker (and stay in order with manual commands)
+        if self._auto_sends_inline:
+            self._send_command(command)
+            return
+        self._submit_command(self._send_command, command)
+
+    def _submit_auto_batch(self, commands):
+        if self._auto_sends_inline:
+            self._send_batch(commands)
+            return
+        self._submit_command(self._send_batch, commands)
+
+    def _cancel_pending_commands(self):
+        while True:
+            try:
+                self._command_queue.get_nowait()
+            except Empty:
+                break
+
     def _send_command(self, command: str):
         if not command:
             logger.warning("Attempted to send empty command")
             return
 
         try:
-            if not self.tcp_command_client.is_connected():
-                self._update_status(
-                    f"Connecting to {self.target_ip}:{self.target_tcp_command_port}...",
-                    "blue",
-                )
-                self._update_data_display(
-                    f"[System] Attempting to connect to target at {self.target_ip}:{self.target_tcp_command_port}"
-                )
-
-                if not self.tcp_command_client.connect():
-                    self._update_status(
-                        f"Failed to connect to {self.target_ip}:{self.target_tcp_command_port}",
-                        "red",
-                    )
-                    self._update_data_display(
-                        f"[ERROR] Cannot send command {command} - connection failed"
-                    )
-                    self._update_data_display(f"[TROUBLESHOOTING] Check:")
-                    self._update_data_display(
-                        f"  - Is target running? (python src/Target_Codebase/target_main.py)"
-                    )
-                    self._update_data_display(
-                        f"  - Is target IP correct? (Expected: {self.target_ip})"
-                    )
-                    self._update_data_display(
-                        f"  - Can you ping target? (ping {self.target_ip})"
-                    )
-                    self._update_data_display(
-                        f"  - Is firewall blocking port {self.target_tcp_command_port}?"
-                    )
-                    return
+            if not self._ensure_target_connection(command):
+                return
 
             self._update_status(f"Sending command: {command}...", "blue")
             response = self.tcp_command_client.send_command(command)
+            self._handle_command_response(command, response)
 
-            if response and ("ADC_CH" in response or "ADC_DATA" in response):
-                try:
-                    parsed = {}
-                    parts = response.split("|")
-                    for part in parts:
-                        if ":" in part:
-                            key, value = part.split(":", 1)
-                            parsed[key] = value
-                    
-                    adc_values = ["---"] * 8
-                    for ch in range(8):
-                        adc_key = f"ADC_CH{ch}"
-                        if adc_key in parsed:
-                            adc_values[ch] = parsed[adc_key]
-                    
-                    if any(v != "---" for v in adc_values):
-                        self._update_all_adc_channels(adc_values)
-                    
-                    adc_data = parsed.get("ADC_DATA")
-                    if adc_data:
-                        try:
-                            if isinstance(adc_data, str):
-                                adc_list = []
-                                for x in adc_data.split(","):
-                                    x = x.strip()
-                                    if x.upper() in ["FLOATING", "UNUSED"]:
-                                        adc_list.append(x.upper())
-                                    else:
-                                        try:
-                                            adc_list.append(int(x))
-                                        except ValueError:
-                                            adc_list.append(x)
-                                
-                                for i, val in enumerate(adc_list[:3]):
-                                    if i < len(adc_values):
-                                        adc_values[i] = val
-                                
-                                self._update_all_adc_channels(adc_values)
-                        except Exception as e:
-                            logger.warning(f"Error parsing ADC_DATA from command response: {e}")
-                except Exception as e:
-                    logger.warning(f"Error processing ADC response: {e}")
-
-            if response and "NODE_" in response and "_VOLTAGE:" in response:
-                try:
-                    parts = response.split(":")
-                    if len(parts) >= 2:
-                        node_part = parts[0].replace("NODE_", "").replace("_VOLTAGE", "")
-                        node_id = int(node_part)
-                        voltage = float(parts[1])
-                        
-                        if node_id == 3:
-                            voltage_kv = voltage / 1000.0
-                            if self.auto_controller:
-                                self.auto_controller._last_voltage_kv = voltage_kv
-                                if self.auto_controller.currentState == State.DEENERGIZING:
-                                    if abs(voltage_kv) < 0.1:
-                                        self.auto_controller.dispatch_event(Event.ZERO_KV_STEADY)
-                        self._update_voltage_display(node_id, voltage)
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Error parsing voltage response: {e}")
+        except Exception as e:
+            logger.error(f"Error sending command {command}: {e}")
+            self._update_status(f"Error sending command: {e}", "red")
+            self._update_data_display(f"[ERROR] Command {command} failed: {e}")
 
-            if response and "NODE_" in response and "_CURRENT:" in response:
-                try:
-                    parts = response.split(":")
-                    if len(parts) >= 2:
-                        node_part = parts[0].replace("NODE_", "").replace("_CURRENT", "")
-                        node_id = int(node_part)
-                        current = float(parts[1])
-                        self._update_current_display(node_id, current)
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Error parsing current response: {e}")
+    def _send_batch(self, commands):
+        # Reads that go to the same target are answered in one round trip
+        # instead of one request/response wait per command
+        batch = self.command_handler.build_batch_command(commands)
+        if not batch:
+            for command in commands:
+                self._send_command(command)
+            return
 
-            if response:
-                if "SUCCESS" in response.upper():
-                    self._update_status(
-                        f"Command sent: {command} - Response: {response}", "green"
-                    )
-                elif "FAILED" in response.upper() or "ERROR" in response.upper():
-                    self._update_status(
-                        f"Command sent: {command} - Response: {response}", "red"
-                    )
+        try:
+            if not self._ensure_target_connection(batch):
+                return
+
+            self._update_status(f"Sending command: {batch}...", "blue")
+            response = self.tcp_command_client.send_command(batch)
+            responses = response.split(BATCH_SEPARATOR) if response else []
+            if len(responses) != len(commands):
+                self._handle_command_response(batch, response)
+                return
+            for command, command_response in zip(commands, responses):
+                self._handle_command_response(command, command_response)
+
+        except Exception as e:
+            logger.error(f"Error sending command {batch}: {e}")
+            self._update_status(f"Error sending command: {e}", "red")
+            self._update_data_display(f"[ERROR] Command {batch} failed: {e}")
+
+    def _ensure_target_connection(self, command: str) -> bool:
+        if self.tcp_command_client.is_connected():
+            return True
+
+        self._update_status(
+            f"Connecting to {self.target_ip}:{self.target_tcp_command_port}...",
+            "blue",
+        )
+        self._update_data_display(
+            f"[System] Attempting to connect to target at {self.target_ip}:{self.target_tcp_command_port}"
+        )
+
+        if not self.tcp_command_client.connect():
+            self._update_status(
+                f"Failed to connect to {self.target_ip}:{self.target_tcp_command_port}",
+                "red",
+            )
+            self._update_data_display(
+                f"[ERROR] Cannot send command {command} - connection failed"
+            )
+            self._update_data_display(f"[TROUBLESHOOTING] Check:")
+            self._update_data_display(
+                f"  - Is target running? (python src/Target_Codebase/target_main.py)"
+            )
+            self._update_data_display(
+                f"  - Is target IP correct? (Expected: {self.target_ip})"
+            )
+            self._update_data_display(
+                f"  - Can you ping target? (ping {self.target_ip})"
+            )
+            self._update_data_display(
+                f"  - Is firewall blocking port {self.target_tcp_command_port}?"
+            )
+            return False
+        return True
+
+    def _handle_command_response(self, command: str, response):
+        if response and "NODE_" in response and "_VOLTAGE:" in response:
+            try:
+                parts = response.split(":")
+                if len(parts) >= 2:
+                    node_part = parts[0].replace("NODE_", "").replace("_VOLTAGE", "")
+                    node_id = int(node_part)
+                    voltage = float(parts[1])
+                    
+                    if node_id == 3:
+                        voltage_kv = voltage / 1000.0
+                        if self.auto_controller:
+                            self.auto_controller._last_voltage_kv = voltage_kv
+                            if self.auto_controller.currentState == State.DEENERGIZING:
+                                if abs(voltage_kv) < 0.1:
+                                    self.auto_controller.dispatch_event(Event.ZERO_KV_STEADY)
+                    self._update_voltage_display(node_id, voltage)
+            except (ValueError, IndexError) as e:
+                logger.warning(f"Error parsing voltage response: {e}")
+
+        if response and "NODE_" in response and "_CURRENT:" in response:
+            try:
+                parts = response.split(":")
+                if len(parts) >= 2:
+                    node_part = parts[0].replace("NODE_", "").replace("_CURRENT", "")
+                    node_id = int(node_part)
+                    current = float(parts[1])
+                    self._update_current_display(node_id, current)
+            except (ValueError, IndexError) as e:
+                logger.warning(f"Error parsing current response: {e}")
+
+        if response:
+            if "SUCCESS" in response.upper():
+                self._update_status(
+                    f"Command sent: {command} - Response: {response}", "green"
+                )
+            elif "FAILED" in response.upper() or "ERROR" in response.upper():
+                self._update_status(
+                    f"Command sent: {command} - Response: {response}", "red"
+                )
+                
+                if ":" in response:
+                    error_detail = response.split(":", 1)[1].strip()
                     
-                    if ":" in response:
-                        error_detail = response.split(":", 1)[1].strip()
+                    if command in ["LED_ON", "LED_OFF"]:
+                        print("\n" + "=" * 70, flush=True)
+                        print(f"LED COMMAND FAILED: {command}", flush=True)
+                        print("=" * 70, flush=True)
+                        print(f"Error from target: {error_detail}", flush=True)
+                        print("-" * 70, flush=True)
                         
-                        if command in ["LED_ON", "LED_OFF"]:
-                            print("\n" + "=" * 70, flush=True)
-                            print(f"LED COMMAND FAILED: {command}", flush=True)
-                            print("=" * 70, flush=True)
-                            print(f"Error from target: {error_detail}", flush=True)
-                            print("-" * 70, flush=True)
-                            
-                            # Provide specific troubleshooting based on error type
-                            if "GPIO not initialized" in error_detail:
-                                print(
-                                    "ROOT CAUSE: GPIO hardware not initialized on target",
-                                    flush=True,
-                                )
-                                print(
-                                    "SOLUTION: Target must be running with 'sudo' privileges",
-                                    flush=True,
-                                )
-                                print(
-                                    "ACTION: Run target with: sudo python3 target_main.py",
-                                    flush=True,
-                                )
-                                self._update_data_display(
-                                    "[TROUBLESHOOTING] GPIO not initialized - ensure target is running with 'sudo'"
-                                )
-                            elif "Permission denied" in error_detail:
-                                print(
-                                    "ROOT CAUSE: Insufficient permissions to access GPIO pins",
-                                    flush=True,
-                                )
-                                print(
-                                    "SOLUTION: Target process needs root/sudo access",
-                                    flush=True,
-                                )
-                                print(
-                                    "ACTION: Restart target with: sudo python3 target_main.py",
-                                    flush=True,
-                                )
-                                self._update_data_display(
-                                    "[TROUBLESHOOTING] Permission denied - target must run with 'sudo' to access GPIO"
-                                )
-                            elif (
-                                "RuntimeError" in error_detail
-                                or "GPIO channels already in use" in error_detail
-                            ):
-                                print(
-                                    "ROOT CAUSE: GPIO pins are locked/in use by another process",
-                                    flush=True,
-                                )
-                                print(
-                                    "SOLUTION: Clean up GPIO state and restart target",
-                                    flush=True,
-                                )
-                                print(
-                                    "ACTION: Restart target with: sudo python3 target_main.py",
-                                    flush=True,
-                                )
-                                print(
-                                    "        Or stop any other processes using GPIO pins",
-                                    flush=True,
-                                )
-                                self._update_data_display(
-                                    "[TROUBLESHOOTING] GPIO RuntimeError - pins may be in use, restart target"
-                                )
-                            elif "OS Error" in error_detail:
-                                print(
-                                    "ROOT CAUSE: GPIO hardware access error", flush=True
-                                )
-                                print(
-                                    "SOLUTION: Check hardware connections and GPIO wiring",
-                                    flush=True,
-                                )
-                                print(
-                                    "ACTION: Verify LED is connected to correct GPIO pin (default: pin 26)",
-                                    flush=True,
-                                )
-                                self._update_data_display(
-                                    "[TROUBLESHOOTING] GPIO hardware error - check wiring and GPIO connections"
-                                )
-                            else:
-                                print(f"ROOT CAUSE: {error_detail}", flush=True)
-                                print(
-                                    "SOLUTION: Check target logs for more details",
-                                    flush=True,
-                                )
-                            
-                            print("=" * 70 + "\n", flush=True)
-                            
-                            # Also log via standard method
-                            self._log_terminal_update(
-                                "LED_ERROR", f"{command} failed: {error_detail}"
+                        # Provide specific troubleshooting based on error type
+                        if "GPIO not initialized" in error_detail:
+                            print(
+                                "ROOT CAUSE: GPIO hardware not initialized on target",
+                                flush=True,
+                            )
+                            print(
+                                "SOLUTION: Target must be running with 'sudo' privileges",
+                                flush=True,
+                            )
+                            print(
+                                "ACTION: Run target with: sudo python3 target_main.py",
+                                flush=True,
+                            )
+                            self._update_data_display(
+                                "[TROUBLESHOOTING] GPIO not initialized - ensure target is running with 'sudo'"
+                            )
+                        elif "Permission denied" in error_detail:
+                            print(
+                                "ROOT CAUSE: Insufficient permissions to access GPIO pins",
+                                flush=True,
+                            )
+                            print(
+                                "SOLUTION: Target process needs root/sudo access",
+                                flush=True,
+                            )
+                            print(
+                                "ACTION: Restart target with: sudo python3 target_main.py",
+                                flush=True,
+                            )
+                            self._update_data_display(
+                                "[TROUBLESHOOTING] Permission denied - target must run with 'sudo' to access GPIO"
+                            )
+                        elif (
+                            "RuntimeError" in error_detail
+                            or "GPIO channels already in use" in error_detail
+                        ):
+                            print(
+                                "ROOT CAUSE: GPIO pins are locked/in use by another process",
+                                flush=True,
+                            )
+                            print(
+                                "SOLUTION: Clean up GPIO state and restart target",
+                                flush=True,
+                            )
+                            print(
+                                "ACTION: Restart target with: sudo python3 target_main.py",
+                                flush=True,
+                            )
+                            print(
+                                "        Or stop any other processes using GPIO pins",
+                                flush=True,
+                            )
+                            self._update_data_display(
+                                "[TROUBLESHOOTING] GPIO RuntimeError - pins may be in use, restart target"
+                            )
+                        elif "OS Error" in error_detail:
+                            print(
+                                "ROOT CAUSE: GPIO hardware access error", flush=True
+                            )
+                            print(
+                                "SOLUTION: Check hardware connections and GPIO wiring",
+                                flush=True,
+                            )
+                            print(
+                                "ACTION: Verify LED is connected to correct GPIO pin (default: pin 26)",
+                                flush=True,
+                            )
+                            self._update_data_display(
+                                "[TROUBLESHOOTING] GPIO hardware error - check wiring and GPIO connections"
                             )
                         else:
-                            self._log_terminal_update(
-                                "COMMAND_ERROR", f"{command} -> {response}"
+                            print(f"ROOT CAUSE: {error_detail}", flush=True)
+                            print(
+                                "SOLUTION: Check target logs for more details",
+                                flush=True,
                             )
                         
-                        self._update_data_display(
-                            f"[ERROR] {command} failed: {error_detail}"
+                        print("=" * 70 + "\n", flush=True)
+                        
+                        # Also log via standard method
+                        self._log_terminal_update(
+                            "LED_ERROR", f"{command} failed: {error_detail}"
                         )
                     else:
                         self._log_terminal_update(
                             "COMMAND_ERROR", f"{command} -> {response}"
                         )
-                        self._update_data_display(
-                            f"[ERROR] {command} failed: {response}"
-                        )
+                    
+                    self._update_data_display(
+                        f"[ERROR] {command} failed: {error_detail}"
+                    )
                 else:
-                    self._update_status(
-                        f"Command sent: {command} - Response: {response}", "blue"
+                    self._log_terminal_update(
+                        "COMMAND_ERROR", f"{command} -> {response}"
+                    )
+                    self._update_data_display(
+                        f"[ERROR] {command} failed: {response}"
                     )
-                self._update_data_display(
-                    f"[COMMAND] {command} -> [RESPONSE] {response}"
-                )
             else:
-                self._update_status(f"Command sent: {command} - No response", "yellow")
-                self._update_data_display(
-                    f"[COMMAND] {command} -> [RESPONSE] (no response)"
+                self._update_status(
+                    f"Command sent: {command} - Response: {response}", "blue"
                 )
+            self._update_data_display(
+                f"[COMMAND] {command} -> [RESPONSE] {response}"
+            )
+        else:
+            self._update_status(f"Command sent: {command} - No response", "yellow")
+            self._update_data_display(
+                f"[COMMAND] {command} -> [RESPONSE] (no response)"
+            )
 
-        except Exception as e:
-            logger.error(f"Error sending command {command}: {e}")
-            self._update_status(f"Error sending command: {e}", "red")
-            self._update_data_display(f"[ERROR] Command {command} failed: {e}")
+    def _slider_label_changed(self, key, value: int) -> bool:
+        # Sliders report every sub-step of a drag; only redraw the readout when
+        # the displayed whole number actually changes
+        if self._slider_label_values.get(key) == value:
+            return False
+        self._slider_label_values[key] = value
+        return True
 
     def _update_voltage_label(self, value):
-        if hasattr(self, "voltage_value_label"):
-            self.voltage_value_label.configure(text=f"{int(value)} V")
+        value = int(value)
+        if hasattr(self, "voltage_value_label") and self._slider_label_changed(
+            "voltage", value
+        ):
+            self.voltage_value_label.configure(text=f"{value} V")
 
     def _update_pump_label(self, value):
-        if hasattr(self, "pump_value_label"):
-            self.pump_value_label.configure(text=f"{int(value)}%")
+        value = int(value)
+        if hasattr(self, "pump_value_label") and self._slider_label_changed(
+            "pump", value
+        ):
+            self.pump_value_label.configure(text=_PERCENT_LABELS[value])
 
     def _update_valve_label(self, valve_key, idx, value):
-        if valve_key and valve_key in self.valve_value_labels:
-            self.valve_value_labels[valve_key].configure(text=f"{int(value)}%")
+        value = int(value)
+        if (
+            valve_key
+            and valve_key in self.valve_value_labels
+            and self._slider_label_changed(valve_key, value)
+        ):
+            self.valve_value_labels[valve_key].configure(text=_PERCENT_LABELS[value])
+
+    def _set_valve_from_slider(self, valve_name: str):
+        self._set_valve(valve_name, self.valve_sliders[valve_name].get())
 
     def _set_valve(self, valve_name: str, value: float):
         if self._is_auto_mode_active():
@@ -1663,12 +979,21 @@ class FusorHostApp:
         
         if actuator:
             self._update_status(f"Setting {valve_name} to {int(value)}%...", "blue")
-            actuator.setAnalogValue(value)
+            self._submit_command(actuator.setAnalogValue, value)
             self._update_data_display(f"[VALVE] Setting {valve_name} to {int(value)}%")
         else:
             self._update_status(f"Valve {valve_name} not found", "red")
             self._update_data_display(f"[ERROR] Valve {valve_name} not found")
 
+    def _set_label_text(self, label, text: str):
+        # A CTkLabel configure redraws the whole widget even when the text is
+        # unchanged, so skip writes that would not change what is shown
+        key = str(label)
+        if self._label_texts.get(key) == text:
+            return
+        self._label_texts[key] = text
+        label.configure(text=text)
+
     def _update_voltage_display(self, node_id: int, voltage: float):
         if not self.root:
             return
@@ -1677,23 +1002,23 @@ class FusorHostApp:
             try:
                 if node_id == 1:
                     if hasattr(self, "rectifier_voltage_label") and self.rectifier_voltage_label:
-                        self.rectifier_voltage_label.configure(
-                            text=f"Rectifier: {voltage:.2f} V"
+                        self._set_label_text(
+                            self.rectifier_voltage_label, f"Rectifier: {voltage:.2f} V"
                         )
                 elif node_id == 2:
                     if hasattr(self, "transformer_voltage_label") and self.transformer_voltage_label:
-                        self.transformer_voltage_label.configure(
-                            text=f"Transformer: {voltage:.2f} V"
+                        self._set_label_text(
+                            self.transformer_voltage_label, f"Transformer: {voltage:.2f} V"
                         )
                 elif node_id == 3:
                     if hasattr(self, "vmultiplier_voltage_label") and self.vmultiplier_voltage_label:
-                        self.vmultiplier_voltage_label.configure(
-                            text=f"V-Multiplier: {voltage:.2f} V"
+                        self._set_label_text(
+                            self.vmultiplier_voltage_label, f"V-Multiplier: {voltage:.2f} V"
                         )
             except Exception:
                 pass
 
-        self._schedule_gui_update(_do_update)
+        self._schedule_latest_gui_update(("voltage", node_id), _do_update)
 
     def _update_current_display(self, node_id: int, current: float):
         if not self.root:
@@ -1703,118 +1028,39 @@ class FusorHostApp:
             try:
                 if node_id == 1:
                     if hasattr(self, "rectifier_current_label") and self.rectifier_current_label:
-                        self.rectifier_current_label.configure(
-                            text=f"Rectifier: {current:.3f} A"
+                        self._set_label_text(
+                            self.rectifier_current_label, f"Rectifier: {current:.3f} A"
                         )
                 elif node_id == 3:
                     if hasattr(self, "vmultiplier_current_label") and self.vmultiplier_current_label:
-                        self.vmultiplier_current_label.configure(
-                            text=f"V-Multiplier: {current:.3f} A"
+                        self._set_label_text(
+                            self.vmultiplier_current_label, f"V-Multiplier: {current:.3f} A"
                         )
             except Exception:
                 pass
 
-        self._schedule_gui_update(_do_update)
+        self._schedule_latest_gui_update(("current", node_id), _do_update)
 
     def _update_pressure_display(self, sensor_id: int, value):
         if not self.root:
             return
-
-        def _do_update():
-            try:
-                if sensor_id == 1:
-                    if hasattr(self, "pressure_display1") and self.pressure_display1:
-                        self.pressure_display1.configure(
-                            text=f"TC Gauge 1 [ADC CH0]: {value}"
-                        )
-                    if hasattr(self, "pressure_label") and self.pressure_label:
-                        self.pressure_label.configure(
-                            text=f"TC Gauge 1 [ADC CH0]: {value}"
-                        )
-                elif sensor_id == 2:
-                    if hasattr(self, "pressure_display2") and self.pressure_display2:
-                        self.pressure_display2.configure(
-                            text=f"TC Gauge 2 [ADC CH1]: {value}"
-                        )
-                elif sensor_id == 3:
-                    if hasattr(self, "pressure_display3") and self.pressure_display3:
-                        self.pressure_display3.configure(
-                            text=f"Manometer 1 [ADC CH2]: {value}"
-                        )
-            except Exception:
-                pass
-
-        self._schedule_gui_update(_do_update)
-
-    def _update_adc_display(self, value):
-        if not self.root:
+        # Readings arrive on every telemetry packet; only queue a redraw when
+        # the shown value actually changes
+        if self._pressure_display_values.get(sensor_id) == value:
             return
+        self._pressure_display_values[sensor_id] = value
 
-        def _do_update():
-            try:
-                display_value = "FLOATING (No sensor connected)" if str(value).upper() == "FLOATING" else value
-                if hasattr(self, "adc_ch0_label") and self.adc_ch0_label:
-                    self.adc_ch0_label.configure(
-                        text=f"ADC CH0 [TC Gauge 1]: {display_value}"
-                    )
-                if hasattr(self, "adc_label") and self.adc_label:
-                    self.adc_label.configure(
-                        text=f"ADC CH0 [TC Gauge 1]: {display_value}"
-                    )
-            except Exception:
-                pass
-
-        self._schedule_gui_update(_do_update)
-
-    def _update_all_adc_channels(self, adc_data):
-        if not self.root:
-            return
+        text = f"{PRESSURE_READOUT_CAPTIONS[sensor_id]}: {value}"
 
         def _do_update():
             try:
-                adc_channels = {
-                    "adc_ch0_label": 0,
-                    "adc_ch1_label": 1,
-                    "adc_ch2_label": 2,
-                    "adc_ch3_label": 3,
-                    "adc_ch4_label": 4,
-                    "adc_ch5_label": 5,
-                    "adc_ch6_label": 6,
-                    "adc_ch7_label": 7,
-                }
-
-                if isinstance(adc_data, (list, tuple)) and len(adc_data) >= 8:
-                    channel_labels = {
-                        0: "ADC CH0 [TC Gauge 1]",
-                        1: "ADC CH1 [TC Gauge 2]",
-                        2: "ADC CH2 [Manometer 1]",
-                        3: "ADC CH3",
-                        4: "ADC CH4",
-                        5: "ADC CH5",
-                        6: "ADC CH6",
-                        7: "ADC CH7",
-                    }
-                    for label_attr, channel in adc_channels.items():
-                        if hasattr(self, label_attr):
-                            label = getattr(self, label_attr)
-                            if label:
-                                label_text = channel_labels.get(
-                                    channel, f"ADC CH{channel}"
-                                )
-                                channel_value = adc_data[channel]
-                                if str(channel_value).upper() == "FLOATING":
-                                    display_value = "FLOATING (No sensor connected)"
-                                elif str(channel_value).upper() == "UNUSED":
-                                    display_value = "UNUSED"
-                                else:
-                                    display_value = channel_value
-                                label.configure(
-                                    text=f"{label_text}: {display_value}"
-                                )
+                pressure_var = self._pressure_vars.get(sensor_id)
+                if pressure_var is not None:
+                    pressure_var.set(text)
             except Exception:
                 pass
 
-        self._schedule_gui_update(_do_update)
+        self._schedule_latest_gui_update(("pressure", sensor_id), _do_update)
 
     def _is_auto_mode_active(self):
         """Check if auto mode is currently active (not in ALL_OFF state)"""
@@ -1893,6 +1139,8 @@ class FusorHostApp:
     def _emergency_stop(self):
         """Emergency stop function - immediately stops all systems"""
         self._update_status("EMERGENCY STOP ACTIVATED", "red")
+        # Drop queued manual commands so none of them land after the stop
+        self._cancel_pending_commands()
         self._update_data_display("[EMERGENCY] Emergency stop activated - shutting down all systems")
         
         if self._is_auto_mode_active():
@@ -1900,30 +1148,32 @@ class FusorHostApp:
                 self.auto_log_display.configure(state="normal")
                 self.auto_log_display.insert("end", "[EMERGENCY] Emergency stop from manual tab - returning to ALL_OFF\n")
                 self.auto_log_display.configure(state="disabled")
-            self.auto_controller.dispatch_event(Event.STOP_CMD)
+            # The STOP_CMD transition's outputs (e.g. DEENERGIZING opening the
+            # fusor valve) must reach the target before the zeroing batch
+            self._auto_sends_inline = True
+            try:
+                self.auto_controller.dispatch_event(Event.STOP_CMD)
+            finally:
+                self._auto_sends_inline = False
+        # Drop anything other threads queued while stopping, for the same reason
+        self._cancel_pending_commands()
         
+        # Zero every output in one BATCH round trip instead of one request
+        # and response wait per actuator
+        commands = []
         with self._actuators_lock:
-            if "power_supply" in self.actuators:
-                self.actuators["power_supply"].setAnalogValue(0.0)
-            
-            if "mech_pump" in self.actuators:
-                self.actuators["mech_pump"].setAnalogValue(0.0)
-            if "turbo_pump" in self.actuators:
-                self.actuators["turbo_pump"].setAnalogValue(0.0)
-            
-            if "atm_valve" in self.actuators:
-                self.actuators["atm_valve"].setAnalogValue(0.0)
-            if "foreline_valve" in self.actuators:
-                self.actuators["foreline_valve"].setAnalogValue(0.0)
-            if "fusor_valve" in self.actuators:
-                self.actuators["fusor_valve"].setAnalogValue(0.0)
-            if "deuterium_valve" in self.actuators:
-                self.actuators["deuterium_valve"].setAnalogValue(0.0)
-        
-        self._send_command("POWER_SUPPLY_DISABLE")
+            for actuator_key in EMERGENCY_STOP_ACTUATORS:
+                actuator = self.actuators.get(actuator_key)
+                if actuator:
+                    command = actuator.stageAnalogValue(0.0)
+                    if command:
+                        commands.append(command)
+        commands.append("POWER_SUPPLY_DISABLE")
+        self._send_batch(commands)
         
         if self.voltage_scale:
             self.voltage_scale.set(0)
+            self._update_voltage_label(0)
         if self.manual_mech_switch:
             self.manual_mech_switch.deselect()
             self.manual_mech_switch.configure(text="OFF")
@@ -1936,9 +1186,11 @@ class FusorHostApp:
         for slider in self.valve_sliders.values():
             if slider:
                 slider.set(0)
-        for label in self.valve_value_labels.values():
+        # Through the cached path so a later drag back to the old value
+        # still redraws the label
+        for valve_key, label in self.valve_value_labels.items():
             if label:
-                label.configure(text="0%")
+                self._update_valve_label(valve_key, None, 0)
         
         self._enable_manual_controls()
         
@@ -1996,17 +1248,16 @@ class FusorHostApp:
             self._update_data_display(f"[ERROR] Voltage out of range: {voltage}V")
             return
         
-        # Enable power supply if voltage > 0
-        if voltage > 0:
-            self._update_status("Enabling power supply...", "blue")
-            self._send_command("POWER_SUPPLY_ENABLE")
-            self._update_data_display(f"[POWER] Enabling power supply for {voltage}V")
-        
-        # Set voltage
         command = self.command_handler.build_set_voltage_command(voltage)
         if command:
+            # Enable power supply if voltage > 0, in the same round trip as the setpoint
+            if voltage > 0:
+                self._update_data_display(f"[POWER] Enabling power supply for {voltage}V")
+                command = self.command_handler.build_batch_command(
+                    ["POWER_SUPPLY_ENABLE", command]
+                )
             self._update_status(f"Setting voltage to {voltage}V...", "blue")
-            self._send_command(command)
+            self._submit_command(self._send_command, command)
             self._update_data_display(f"[POWER] Setting voltage to {voltage}V")
         else:
             self._update_status("Failed to build voltage command", "red")
@@ -2016,7 +1267,7 @@ class FusorHostApp:
         power = int(self.pump_power_scale.get())
         command = self.command_handler.build_set_pump_power_command(power)
         if command:
-            self._send_command(command)
+            self._submit_command(self._send_command, command)
         else:
             self._update_status("Invalid power value", "red")
             if hasattr(self, "data_display") and self.data_display:
@@ -2033,7 +1284,7 @@ class FusorHostApp:
         power = 100 if self.manual_mech_switch_state else 0
         self.manual_mech_switch.configure(text="ON" if self.manual_mech_switch_state else "OFF")
         command = f"SET_MECHANICAL_PUMP:{power}"
-        self._send_command(command)
+        self._submit_command(self._send_command, command)
 
     def _toggle_turbo_pump(self):
         if self._is_auto_mode_active():
@@ -2046,14 +1297,14 @@ class FusorHostApp:
         power = 100 if self.turbo_pump_switch_state else 0
         self.turbo_pump_switch.configure(text="ON" if self.turbo_pump_switch_state else "OFF")
         command = f"SET_TURBO_PUMP:{power}"
-        self._send_command(command)
+        self._submit_command(self._send_command, command)
 
     def _move_motor(self):
         try:
             steps = int(self.steps_entry.get())
             command = self.command_handler.build_move_motor_command(steps)
             if command:
-                self._send_command(command)
+                self._submit_command(self._send_command, command)
             else:
                 self._update_status("Invalid steps value", "red")
                 self._update_data_display("[ERROR] Steps must be a number")
@@ -2064,17 +1315,17 @@ class FusorHostApp:
     def _handle_udp_data(self, data: str):
         data_upper = data.upper()
         has_adc_data = (
-            any(f"ADC_CH{ch}:" in data_upper or f"ADC_CH{ch}=" in data_upper for ch in range(8)) 
-            or "ADC_DATA:" in data_upper 
-            or "ADC_DATA=" in data_upper
+            any(marker in data_upper for marker in ADC_DATA_MARKERS)
         )
         if not has_adc_data:
             self._update_data_display(f"[UDP Data] {data}")
         parsed = self._parse_periodic_packet(data)
         
-        if any(f"ADC_CH{ch}" in parsed for ch in range(8)):
-            adc_debug = {f"ADC_CH{ch}": parsed.get(f"ADC_CH{ch}") for ch in range(8)}
-            logger.debug(f"Parsed ADC channels from UDP: {adc_debug}")
+        if logger.isEnabledFor(logging.DEBUG) and any(
+            key in parsed for key in ADC_CHANNEL_KEYS
+        ):
+            adc_debug = {key: parsed.get(key) for key in ADC_CHANNEL_KEYS}
+            logger.debug("Parsed ADC channels from UDP: %s", adc_debug)
         
         has_error = any(
             "ERROR" in str(v).upper()
@@ -2145,41 +1396,22 @@ class FusorHostApp:
                                 values_changed = True
                                 changed_items.append(f"{key}={value}")
             
-            adc_values = []
-            for ch in range(8):
-                adc_key = f"ADC_CH{ch}"
-                adc_value = parsed.get(adc_key)
-                if adc_value is None:
-                    adc_value = "---"
-                adc_values.append(adc_value)
-                if ch == 0:
-                    self._update_adc_display(adc_value)
-            
+            adc_values = [parsed.get(key, "---") for key in ADC_CHANNEL_KEYS]
             if any(v != "---" for v in adc_values):
                 self.auto_controller.update_adc_values(adc_values)
-            
-            if any(v != "---" for v in adc_values):
-                logger.debug(f"Updating ADC channels with values: {adc_values}")
-                self._update_all_adc_channels(adc_values)
-            elif any(f"ADC_CH{ch}" in parsed for ch in range(8)):
-                logger.debug(f"ADC channels found in parsed data but all are None: {[parsed.get(f'ADC_CH{ch}') for ch in range(8)]}")
-                self._update_all_adc_channels(adc_values)
-
-            for sensor_id in range(1, 4):
-                pressure_key = f"PRESSURE_SENSOR_{sensor_id}_VALUE"
+
+            for pressure_key in PRESSURE_VALUE_KEYS:
                 pressure_value = parsed.get(pressure_key)
                 if pressure_value:
-                    matched_sensor = self.udp_client_object.process_received_data(f"{pressure_key}:{pressure_value}")
-                    if matched_sensor:
+                    matched_sensor = self.udp_client_object.process_received_data(
+                        pressure_key + ":" + pressure_value
+                    )
+                    display_id = PRESSURE_DISPLAY_IDS.get(matched_sensor)
+                    if display_id:
                         with self._sensors_lock:
                             sensor = self.sensors.get(matched_sensor)
                             if sensor and sensor.value is not None:
-                                if matched_sensor == "pressure_sensor_1":
-                                    self._update_pressure_display(1, sensor.value)
-                                elif matched_sensor == "pressure_sensor_2":
-                                    self._update_pressure_display(2, sensor.value)
-                                elif matched_sensor == "pressure_sensor_3":
-                                    self._update_pressure_display(3, sensor.value)
+                                self._update_pressure_display(display_id, sensor.value)
 
             adc_data = parsed.get("ADC_DATA")
             if adc_data:
@@ -2199,7 +1431,6 @@ class FusorHostApp:
                         adc_list = list(adc_data)
                     if len(adc_list) >= 8:
                         self.auto_controller.update_adc_values(adc_list)
-                        self._update_all_adc_channels(adc_list)
                 except (ValueError, TypeError) as e:
                     logger.warning(f"Error parsing ADC_DATA: {e}, data: {adc_data}")
                     pass
@@ -2249,29 +1480,29 @@ class FusorHostApp:
             current_state = self.auto_controller.currentState if self.auto_controller else None
             
             if current_state == State.ROUGH_PUMP_DOWN and pressure_foreline is not None:
-                telemetry["APS_location"] = "Foreline"
+                telemetry["APS_location"] = APS_FORELINE
                 telemetry["APS_pressure_Torr"] = pressure_foreline
             elif current_state == State.RP_DOWN_TURBO and pressure_turbo is not None:
-                telemetry["APS_location"] = "Turbo"
+                telemetry["APS_location"] = APS_TURBO
                 telemetry["APS_pressure_Torr"] = pressure_turbo
             elif current_state in [State.TURBO_PUMP_DOWN, State.TP_DOWN_MAIN, State.SETTLE_STEADY_PRESSURE, State.SETTLING_10KV]:
                 # For these states, prefer Main, fallback to Turbo
                 if pressure_main is not None:
-                    telemetry["APS_location"] = "Main"
+                    telemetry["APS_location"] = APS_MAIN
                     telemetry["APS_pressure_Torr"] = pressure_main
                 elif pressure_turbo is not None:
-                    telemetry["APS_location"] = "Turbo"
+                    telemetry["APS_location"] = APS_TURBO
                     telemetry["APS_pressure_Torr"] = pressure_turbo
             else:
                 # Default: use Main if available, otherwise Turbo, otherwise Foreline
                 if pressure_main is not None:
-                    telemetry["APS_location"] = "Main"
+                    telemetry["APS_location"] = APS_MAIN
                     telemetry["APS_pressure_Torr"] = pressure_main
                 elif pressure_turbo is not None:
-                    telemetry["APS_location"] = "Turbo"
+                    telemetry["APS_location"] = APS_TURBO
                     telemetry["APS_pressure_Torr"] = pressure_turbo
                 elif pressure_foreline is not None:
-                    telemetry["APS_location"] = "Foreline"
+                    telemetry["APS_location"] = APS_FORELINE
                     telemetry["APS_pressure_Torr"] = pressure_foreline
             
             voltage_kv = parsed.get("VOLTAGE_KV") or parsed.get("voltage_kV") or parsed.get("VOLTAGE")
@@ -2340,7 +1571,7 @@ class FusorHostApp:
                     )
                     if summary:
                         # Double-check no ADC or pressure sensor data slipped through
-                        if (not any(f"ADC_CH{ch}" in summary for ch in range(8)) 
+                        if (not any(key in summary for key in ADC_CHANNEL_KEYS) 
                             and "ADC_DATA" not in summary 
                             and "PRESSURE_SENSOR_" not in summary):
                             self._update_target_logs(f"[UDP Data] {summary}")
@@ -2348,9 +1579,7 @@ class FusorHostApp:
         else:
             data_upper = data.upper()
             has_adc_data = (
-                any(f"ADC_CH{ch}:" in data_upper or f"ADC_CH{ch}=" in data_upper for ch in range(8)) 
-                or "ADC_DATA:" in data_upper 
-                or "ADC_DATA=" in data_upper
+                any(marker in data_upper for marker in ADC_DATA_MARKERS)
             )
             if not has_adc_data:
                 if has_error or "ERROR" in data.upper():
@@ -2443,7 +1672,17 @@ class FusorHostApp:
                                 except Exception:
                                     pass
                             self.previous_values["Pressure_Sensor_3"] = sensor.value
-        
+
+        # Only JSON objects carry FSM telemetry; most status lines are
+        # pipe-delimited text, so don't pay for a failed json.loads on those
+        if not message.lstrip().startswith("{"):
+            if has_error:
+                try:
+                    self._log_terminal_update("TARGET_ERROR", message)
+                except Exception:
+                    pass
+            return
+
         try:
             payload = json.loads(message)
             telemetry = payload.get("telemetry")
@@ -2464,22 +1703,58 @@ class FusorHostApp:
                     pass
 
     def _process_gui_updates(self):
-        try:
-            while not self._gui_update_queue.empty():
-                try:
-                    update_func, args, kwargs = self._gui_update_queue.get_nowait()
-                    update_func(*args, **kwargs)
-                except Exception as e:
-                    logger.error(f"Error processing GUI update: {e}")
-        except Exception:
-            pass
+        # Only run what was queued when this tick started, so a steady stream
+        # of new updates can't keep the Tk loop here indefinitely
+        gui_updates = self._gui_update_queue
+        processed = len(gui_updates)
+        for _ in range(processed):
+            try:
+                update_func, args, kwargs = gui_updates.popleft()
+            except IndexError:
+                # Cleared by stop() mid-drain
+                break
+            try:
+                update_func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error processing GUI update: {e}")
+
+        with self._latest_gui_updates_lock:
+            latest_updates = self._latest_gui_updates
+            self._latest_gui_updates = {}
+        processed += len(latest_updates)
+        for update_func in latest_updates.values():
+            try:
+                update_func()
+            except Exception as e:
+                logger.error(f"Error processing GUI update: {e}")
 
         if self.root and not self._shutdown_event.is_set():
-            self.root.after(50, self._process_gui_updates)
+            self.root.after(
+                self._next_gui_poll_interval(processed), self._process_gui_updates
+            )
+
+    def _next_gui_poll_interval(self, processed: int) -> int:
+        if processed >= GUI_POLL_BUSY_BATCH:
+            self._gui_poll_interval = GUI_POLL_BUSY_MS
+        elif processed:
+            self._gui_poll_interval = GUI_POLL_ACTIVE_MS
+        else:
+            # Nothing to draw: double the wait up to the idle cap
+            self._gui_poll_interval = min(
+                GUI_POLL_IDLE_MAX_MS, self._gui_poll_interval * 2
+            )
+        return self._gui_poll_interval
 
     def _schedule_gui_update(self, func, *args, **kwargs):
         if self.root and not self._shutdown_event.is_set():
-            self._gui_update_queue.put((func, args, kwargs))
+            self._gui_update_queue.append((func, args, kwargs))
+
+    def _schedule_latest_gui_update(self, key, func):
+        # For readouts that only show the current value: a burst of telemetry
+        # replaces the pending refresh instead of queueing one per packet
+        if self.root and not self._shutdown_event.is_set():
+            with self._latest_gui_updates_lock:
+                self._latest_gui_updates[key] = func
 
     def _open_data_log_window(self):
         if self.data_log_window is not None:
@@ -2546,6 +1821,7 @@ class FusorHostApp:
             except:
                 self.data_reading_window = None
 
+        self._label_texts.clear()
         self.data_reading_window = ctk.CTkToplevel(self.root)
         self.data_reading_window.title("Sensor Data Readouts")
         self.data_reading_window.geometry("800x700")
@@ -2649,12 +1925,21 @@ class FusorHostApp:
         )
         pressure_readout_label.pack(pady=8)
 
+        # The readouts change several times a second; setting a StringVar only
+        # updates the label's text instead of reconfiguring the whole CTkLabel
+        self._pressure_vars = {
+            sensor_id: ctk.StringVar(
+                master=self.data_reading_window, value=f"{caption}: ---"
+            )
+            for sensor_id, caption in PRESSURE_READOUT_CAPTIONS.items()
+        }
+
         pressure_row1 = ctk.CTkFrame(pressure_readout_frame)
         pressure_row1.pack(fill="x", padx=5, pady=5)
 
         self.pressure_display1 = ctk.CTkLabel(
             pressure_row1,
-            text="TC Gauge 1 [ADC CH0]: ---",
+            textvariable=self._pressure_vars[1],
             font=ctk.CTkFont(size=13),
             anchor="w",
             width=400,
@@ -2667,7 +1952,7 @@ class FusorHostApp:
 
         self.pressure_display2 = ctk.CTkLabel(
             pressure_row2,
-            text="TC Gauge 2 [ADC CH1]: ---",
+            textvariable=self._pressure_vars[2],
             font=ctk.CTkFont(size=13),
             anchor="w",
             width=400,
@@ -2680,7 +1965,7 @@ class FusorHostApp:
 
         self.pressure_display3 = ctk.CTkLabel(
             pressure_row3,
-            text="Manometer 1 [ADC CH2]: ---",
+            textvariable=self._pressure_vars[3],
             font=ctk.CTkFont(size=13),
             anchor="w",
             width=400,
@@ -2689,15 +1974,22 @@ class FusorHostApp:
         self.pressure_display3.pack(side="left", padx=8, pady=3)
 
         self.pressure_label = self.pressure_display1
+        # New labels start at "---", so the next readings must be drawn
+        self._pressure_display_values.clear()
 
         self.data_reading_window.protocol("WM_DELETE_WINDOW", self._close_data_reading_window)
         
-        self._send_command("READ_ACTIVE_ADC_CHANNELS")
-        self._send_command("READ_NODE_VOLTAGE:1")  # Rectifier
-        self._send_command("READ_NODE_VOLTAGE:2")  # Transformer
-        self._send_command("READ_NODE_VOLTAGE:3")  # V-Multiplier
-        self._send_command("READ_NODE_CURRENT:1")  # Rectifier
-        self._send_command("READ_NODE_CURRENT:3")  # V-Multiplier
+        self._submit_command(
+            self._send_batch,
+            [
+                "READ_ACTIVE_ADC_CHANNELS",
+                "READ_NODE_VOLTAGE:1",  # Rectifier
+                "READ_NODE_VOLTAGE:2",  # Transformer
+                "READ_NODE_VOLTAGE:3",  # V-Multiplier
+                "READ_NODE_CURRENT:1",  # Rectifier
+                "READ_NODE_CURRENT:3",  # V-Multiplier
+            ],
+        )
 
     def _close_data_reading_window(self):
         if hasattr(self, "data_reading_window") and self.data_reading_window:
@@ -2706,16 +1998,17 @@ class FusorHostApp:
             except:
                 pass
             self.data_reading_window = None
+            self._label_texts.clear()
             self.pressure_display1 = None
             self.pressure_display2 = None
             self.pressure_display3 = None
+            self._pressure_vars = {}
             self.rectifier_voltage_label = None
             self.transformer_voltage_label = None
             self.vmultiplier_voltage_label = None
             self.rectifier_current_label = None
             self.vmultiplier_current_label = None
             self.pressure_label = None
-            self.adc_label = None
 
     def _clear_data_display(self):
         if self.data_display:
@@ -2733,32 +2026,31 @@ class FusorHostApp:
             return
         
         log_upper = log_message.upper()
-        if (any(f"ADC_CH{ch}" in log_upper for ch in range(8)) 
+        if (any(key in log_upper for key in ADC_CHANNEL_KEYS) 
             or "ADC_DATA" in log_upper 
             or "PRESSURE_SENSOR_" in log_upper):
             return
 
-        def _do_update():
-            try:
-                if self.target_logs_display:
-                    timestamp = time.strftime("%H:%M:%S")
-                    self.target_logs_display.configure(state="normal")
-                    self.target_logs_display.insert(
-                        "end", f"[{timestamp}] {log_message}\n"
-                    )
-                    self.target_logs_display.see("end")
-                    lines = self.target_logs_display.get("1.0", "end").split("\n")
-                    if len(lines) > 1000:
-                        self.target_logs_display.delete("1.0", f"{len(lines) - 1000}.0")
-                    self.target_logs_display.configure(state="disabled")
-            except Exception:
-                pass
+        timestamp = time.strftime("%H:%M:%S")
+        self._target_logs_pending.append(f"[{timestamp}] {log_message}\n")
+        self._schedule_latest_gui_update("target_logs", self._flush_target_logs)
 
-        self._schedule_gui_update(_do_update)
+    def _flush_target_logs(self):
+        try:
+            if self.target_logs_display:
+                self.target_logs_display.configure(state="normal")
+                self._append_log_lines(
+                    self.target_logs_display, self._target_logs_pending
+                )
+                self.target_logs_display.configure(state="disabled")
+            else:
+                self._target_logs_pending.clear()
+        except Exception:
+            pass
 
     def _update_data_display(self, data: str):
         data_upper = data.upper()
-        if any(f"ADC_CH{ch}" in data_upper for ch in range(8)) or "ADC_DATA" in data_upper:
+        if any(key in data_upper for key in ADC_CHANNEL_KEYS) or "ADC_DATA" in data_upper:
             return
         
         if not self.data_display or not self.root:
@@ -2766,31 +2058,56 @@ class FusorHostApp:
                 self._log_terminal_update("ERROR", data)
             return
 
-        def _do_update():
-            try:
-                if self.data_display:
-                    timestamp = time.strftime("%H:%M:%S")
-                    self.data_display.insert("end", f"{timestamp} - {data}\n")
-                    self.data_display.see("end")
-            except Exception:
-                pass
+        timestamp = time.strftime("%H:%M:%S")
+        self._data_display_pending.append(f"{timestamp} - {data}\n")
+        self._schedule_latest_gui_update("data_display", self._flush_data_display)
 
-        self._schedule_gui_update(_do_update)
+    def _flush_data_display(self):
+        try:
+            if self.data_display:
+                self._append_log_lines(self.data_display, self._data_display_pending)
+            else:
+                self._data_display_pending.clear()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _append_log_lines(textbox, pending):
+        # Everything queued since the last poll goes in as one insert and one
+        # scroll, however many lines arrived
+        lines = []
+        for _ in range(len(pending)):
+            try:
+                lines.append(pending.popleft())
+            except IndexError:
+                break
+        if not lines:
+            return
+        textbox.insert("end", "".join(lines))
+        # Read the line count off the end index instead of pulling the whole
+        # text back out; the last line is the empty one after the final newline
+        excess = int(textbox.index("end-1c").split(".")[0]) - 1 - LOG_DISPLAY_MAX_LINES
+        if excess > 0:
+            textbox.delete("1.0", f"{excess + 1}.0")
+        textbox.see("end")
 
     def _log_terminal_update(self, tag: str, message: str):
         """Log periodic updates to terminal for visibility."""
         # Filter out any ADC or pressure sensor data (only show communication logs)
         message_upper = message.upper()
-        if (any(f"ADC_CH{ch}" in message_upper for ch in range(8)) 
+        if (any(key in message_upper for key in ADC_CHANNEL_KEYS) 
             or "ADC_DATA" in message_upper 
             or "PRESSURE_SENSOR_" in message_upper):
             return
         
-        timestamp = time.strftime("%H:%M:%S")
         try:
-            print(f"{timestamp} [{tag}] {message}", flush=True)
+            # --no-terminal-updates turns off the mirrored print; the record
+            # still goes through the logger
+            if self.terminal_updates_enabled:
+                timestamp = time.strftime("%H:%M:%S")
+                print(f"{timestamp} [{tag}] {message}", flush=True)
             # Also log via logger for file logging
-            logger.info(f"[{tag}] {message}")
+            logger.info("[%s] %s", tag, message)
         except Exception:
             logger.debug("Failed to write terminal log entry", exc_info=True)
 
@@ -2805,21 +2122,19 @@ class FusorHostApp:
             except Exception:
                 pass
 
-        self._schedule_gui_update(_do_update)
+        self._schedule_latest_gui_update("status", _do_update)
 
     def _parse_periodic_packet(self, payload: str) -> dict:
         result = {}
         if not payload:
             return result
-        parts = payload.split("|")
-        for part in parts:
-            if ":" not in part:
+        for part in payload.split("|"):
+            key, separator, value = part.partition(":")
+            if not separator:
                 continue
-            key, value = part.split(":", 1)
             key = key.strip()
-            value = value.strip()
             if key:
-                result[key] = value
+                result[key] = value.strip()
         return result
 
     def _on_closing(self):
@@ -2846,7 +2161,8 @@ class FusorHostApp:
 
             # Send LED_OFF command
             if self.tcp_command_client.is_connected():
-                self.tcp_command_client.send_command("LED_OFF")
+                # Don't hold up shutdown waiting for the acknowledgement
+                self.tcp_command_client.send_command("LED_OFF", wait_response=False)
                 if self.data_display and self.root:
                     self._update_data_display("[System] LED turned OFF during shutdown")
             else:
@@ -2863,7 +2179,9 @@ class FusorHostApp:
             # Try one more time
             try:
                 if self.tcp_command_client.connect():
-                    self.tcp_command_client.send_command("LED_OFF")
+                    self.tcp_command_client.send_command(
+                        "LED_OFF", wait_response=False
+                    )
             except:
                 pass
 
@@ -2880,6 +2198,11 @@ class FusorHostApp:
         print("TELEMETRY FROM TARGET (displayed below):")
         print("=" * 70)
 
+        self._command_thread = threading.Thread(
+            target=self._command_worker, daemon=True, name="CommandWorker"
+        )
+        self._command_thread.start()
+
         try:
             self.root.mainloop()
         except KeyboardInterrupt:
@@ -2915,14 +2238,10 @@ class FusorHostApp:
         except Exception as e:
             logger.error(f"Error stopping UDP communication: {e}")
 
-        try:
-            while not self._gui_update_queue.empty():
-                try:
-                    self._gui_update_queue.get_nowait()
-                except Exception:
-                    break
-        except Exception as e:
-            logger.error(f"Error clearing GUI update queue: {e}")
+        self._gui_update_queue.clear()
+
+        with self._latest_gui_updates_lock:
+            self._latest_gui_updates.clear()
 
 
 # Global app instance for signal handler access
@@ -1,10 +1,18 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from tcp_command_client import TCPCommandClient
 import threading
 import logging
+import re
 
 logger = logging.getLogger("TCPClientObject")
 
+# Matches names like "valve1", "valve_1", "valve 1"
+VALVE_ID_PATTERN = re.compile(r"valve[_\s]*(\d+)")
+
+# Valves and pumps only ever take 0-100, so their command strings are built
+# once per actuator; voltage spans 0-28000 and is still formatted per send
+PERCENT_COMMAND_VALUES = range(101)
+
 
 class TCPClientObject:
     def __init__(self, tcp_client: TCPCommandClient):
@@ -13,57 +21,82 @@ class TCPClientObject:
         self.label_counter = 0
         self._registry_lock = threading.Lock()
 
+    def _register_locked(self, actuator_name: str, actuator_label: str) -> Dict:
+        label_hex = format(self.label_counter, "04x")
+        # The command type never changes for an actuator, so resolve it from the
+        # name once here instead of re-parsing the name on every send
+        prefix = self._resolve_command_prefix(actuator_name)
+        actuator_info = {
+            "name": actuator_name,
+            "label": actuator_label,
+            "label_hex": label_hex,
+            "command_prefix": prefix,
+            "command_table": self._build_command_table(prefix),
+        }
+        self.actuator_registry[actuator_name] = actuator_info
+        self.label_counter += 1
+        logger.info(
+            "Registered actuator: %s with label '%s' (hex: %s)",
+            actuator_name,
+            actuator_label,
+            label_hex,
+        )
+        return actuator_info
+
     def register_actuator(self, actuator_name: str, actuator_label: str):
         with self._registry_lock:
-            label_hex = format(self.label_counter, "04x")
-            self.actuator_registry[actuator_name] = {
-                "name": actuator_name,
-                "label": actuator_label,
-                "label_hex": label_hex,
-            }
-            self.label_counter += 1
-            logger.info(
-                f"Registered actuator: {actuator_name} with label '{actuator_label}' (hex: {label_hex})"
-            )
+            self._register_locked(actuator_name, actuator_label)
 
-    def send_actuator_command(
+    def build_actuator_command(
         self, actuator_name: str, actuator_value: float, actuator_label: str
-    ):
-        with self._registry_lock:
-            if actuator_name not in self.actuator_registry:
-                label_hex = format(self.label_counter, "04x")
-                self.actuator_registry[actuator_name] = {
-                    "name": actuator_name,
-                    "label": actuator_label,
-                    "label_hex": label_hex,
-                }
-                self.label_counter += 1
-                logger.info(
-                    f"Registered actuator: {actuator_name} with label '{actuator_label}' (hex: {label_hex})"
-                )
-
-            actuator_info = self.actuator_registry[actuator_name]
+    ) -> Optional[str]:
+        """Return the target command for an actuator value without sending it."""
+        return self._command_for(
+            self._actuator_info(actuator_name, actuator_label), actuator_value
+        )
 
-        if not self.tcp_client.is_connected():
-            if not self.tcp_client.connect():
-                logger.error(f"Failed to connect for actuator {actuator_name}")
-                return None
+    def _actuator_info(self, actuator_name: str, actuator_label: str) -> Dict:
+        with self._registry_lock:
+            actuator_info = self.actuator_registry.get(actuator_name)
+            if actuator_info is None:
+                actuator_info = self._register_locked(actuator_name, actuator_label)
+        return actuator_info
 
-        command = self._build_command(actuator_name, actuator_value)
+    def send_actuator_command(
+        self, actuator_name: str, actuator_value: float, actuator_label: str
+    ):
+        actuator_info = self._actuator_info(actuator_name, actuator_label)
+        command = self._command_for(actuator_info, actuator_value)
         if not command:
-            logger.error(f"Cannot build command for actuator {actuator_name} with value {actuator_value}")
+            logger.error(
+                "Cannot build command for actuator %s with value %s",
+                actuator_name,
+                actuator_value,
+            )
             return None
         
-        logger.info(f"Sending actuator command: {actuator_name} = {actuator_value} -> {command}")
+        logger.info(
+            "Sending actuator command: %s = %s -> %s",
+            actuator_name,
+            actuator_value,
+            command,
+        )
         response = self.tcp_client.send_command(command)
         
         if response:
-            logger.info(f"Actuator command response: {response}")
+            logger.info("Actuator command response: %s", response)
         else:
-            logger.warning(f"No response from target for command: {command}")
+            logger.warning("No response from target for command: %s", command)
 
         logger.debug(
-            f"TCP Client Object: Actuator {actuator_name} (label: {actuator_label}, hex: {actuator_info['label_hex']}) -> value: {actuator_value} -> command: {command} -> response: {response}"
+            "TCP Client Object: Actuator %s (label: %s, hex: %s) -> value: %s "
+            "-> command: %s -> response: %s",
+            actuator_name,
+            actuator_label,
+            actuator_info["label_hex"],
+            actuator_value,
+            command,
+            response,
         )
 
         return {
@@ -74,34 +107,52 @@ class TCPClientObject:
             "response": response,
         }
 
-    def _build_command(self, actuator_name: str, value: float) -> str:
+    @staticmethod
+    def _build_command_table(prefix: Optional[str]) -> Tuple[str, ...]:
+        if not prefix or prefix == "SET_VOLTAGE:":
+            return ()
+        return tuple(prefix + str(value) for value in PERCENT_COMMAND_VALUES)
+
+    @staticmethod
+    def _command_for(actuator_info: Dict, value: float) -> Optional[str]:
+        prefix = actuator_info["command_prefix"]
+        if not prefix:
+            return None
+        value = int(value)
+        table = actuator_info["command_table"]
+        if 0 <= value < len(table):
+            return table[value]
+        return prefix + str(value)
+
+    def _resolve_command_prefix(self, actuator_name: str) -> Optional[str]:
         name_lower = actuator_name.lower()
         if "valve" in name_lower:
             valve_id = self._extract_valve_id(actuator_name)
             if valve_id:
-                return f"SET_VALVE{valve_id}:{int(value)}"
+                return f"SET_VALVE{valve_id}:"
             else:
-                logger.warning(f"Could not extract valve ID from actuator name: {actuator_name}")
+                logger.warning(
+                    "Could not extract valve ID from actuator name: %s", actuator_name
+                )
                 return None
         elif "power" in name_lower or ("supply" in name_lower and "power" in name_lower):
-            return f"SET_VOLTAGE:{int(value)}"
+            return "SET_VOLTAGE:"
         elif "pump" in name_lower:
             if (
                 "mechanical" in name_lower
                 or "roughing" in name_lower
             ):
-                return f"SET_MECHANICAL_PUMP:{int(value)}"
+                return "SET_MECHANICAL_PUMP:"
             elif "turbo" in name_lower:
-                return f"SET_TURBO_PUMP:{int(value)}"
-        logger.warning(f"Unknown actuator type: {actuator_name}, cannot build command")
+                return "SET_TURBO_PUMP:"
+        logger.warning("Unknown actuator type: %s, cannot build command", actuator_name)
         return None
 
     def _extract_valve_id(self, actuator_name: str) -> Optional[int]:
         name_lower = actuator_name.lower()
         
         # Try to extract valve ID directly from patterns like "valve1", "valve_1", "valve 1"
-        import re
-        match = re.search(r'valve[_\s]*(\d+)', name_lower)
+        match = VALVE_ID_PATTERN.search(name_lower)
         if match:
             valve_id = int(match.group(1))
             if 1 <= valve_id <= 6:
@@ -1,3 +1,4 @@
+import functools
 import socket
 import threading
 import logging
@@ -8,6 +9,18 @@ from base_classes import CommunicationClientInterface
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("TCPCommandClient")
 
+# Idle time before the OS starts probing a quiet connection (seconds)
+KEEPALIVE_IDLE = 30
+HEARTBEAT_MESSAGE = "HEARTBEAT"
+RECV_CHUNK_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=512)
+def _encode_command(command: str) -> bytes:
+    # Actuator commands come from small fixed sets (see TCPClientObject's
+    # command tables), so most sends reuse an already framed payload
+    return (command.strip() + "\n").encode("utf-8")
+
 
 class TCPCommandClient(CommunicationClientInterface):
     def __init__(self, target_ip: str = "192.168.0.2", target_port: int = 2222):
@@ -15,90 +28,150 @@ class TCPCommandClient(CommunicationClientInterface):
         self.socket: Optional[socket.socket] = None
         self.connection_timeout = 10
         self.receive_timeout = 5
-        self._connection_lock = threading.Lock()
-        self._socket_lock = threading.Lock()
+        # One reentrant lock guards the session so a reconnect can never race
+        # a command that is mid-exchange on the same socket
+        self._lock = threading.RLock()
+        self._recv_buffer = bytearray()
+        self._recv_chunk = bytearray(RECV_CHUNK_SIZE)
+        self._unread_responses = 0
 
-        logger.info(f"TCP Command Client initialized for {target_ip}:{target_port}")
+        logger.info("TCP Command Client initialized for %s:%s", target_ip, target_port)
 
     def connect(self) -> bool:
-        with self._connection_lock:
+        with self._lock:
             try:
-                with self._socket_lock:
-                    if self.socket:
-                        self.socket.close()
-                        self.socket = None
-                    self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    self.socket.settimeout(self.connection_timeout)
-                    self.socket.connect((self.target_ip, self.target_port))
+                if self.socket:
+                    self.socket.close()
+                    self.socket = None
+                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.socket.settimeout(self.connection_timeout)
+                self.socket.connect((self.target_ip, self.target_port))
+                # The session stays open, so switch to the reply timeout once
+                # here rather than on every command
+                self.socket.settimeout(self.receive_timeout)
+                # Commands are tiny request/response lines; don't let Nagle
+                # hold them back waiting for more data
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._enable_keepalive(self.socket)
+                self._recv_buffer.clear()
+                self._unread_responses = 0
                 self.connected = True
                 logger.info(
-                    f"TCP connection established to {self.target_ip}:{self.target_port}"
+                    "TCP connection established to %s:%s",
+                    self.target_ip,
+                    self.target_port,
                 )
                 return True
             except socket.timeout:
                 logger.error(
-                    f"TCP connection timeout: Could not connect to {self.target_ip}:{self.target_port} within {self.connection_timeout}s"
+                    "TCP connection timeout: Could not connect to %s:%s within %ss",
+                    self.target_ip,
+                    self.target_port,
+                    self.connection_timeout,
                 )
-                self.connected = False
-                with self._socket_lock:
-                    if self.socket:
-                        self.socket.close()
-                        self.socket = None
+                self._close_socket()
                 return False
             except Exception as e:
-                logger.error(f"TCP connection failed ({type(e).__name__}): {e}")
-                self.connected = False
-                with self._socket_lock:
-                    if self.socket:
-                        self.socket.close()
-                        self.socket = None
+                logger.error("TCP connection failed (%s): %s", type(e).__name__, e)
+                self._close_socket()
                 return False
 
     def disconnect(self):
-        with self._connection_lock:
+        with self._lock:
             self.connected = False
-            with self._socket_lock:
-                if self.socket:
-                    try:
-                        self.socket.close()
-                        logger.info("TCP connection closed")
-                    except Exception as e:
-                        logger.error(f"Error closing TCP connection: {e}")
-                    self.socket = None
+            if self.socket:
+                try:
+                    self.socket.close()
+                    logger.info("TCP connection closed")
+                except Exception as e:
+                    logger.error("Error closing TCP connection: %s", e)
+                self.socket = None
+
+    def _close_socket(self):
+        self.connected = False
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+
+    def _ensure_connected(self) -> bool:
+        # Reuse the open session; only pay for a new handshake once it is gone
+        if self.connected and self.socket is not None:
+            return True
+        logger.warning("TCP client not connected")
+        return self.connect()
+
+    @staticmethod
+    def _enable_keepalive(sock: socket.socket):
+        # Let the OS probe idle sessions so a dropped link is noticed before the
+        # next command instead of on it
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+
+    def _read_response(self) -> str:
+        # The target answers with newline-terminated lines and sends HEARTBEAT
+        # lines while the session is idle; skip those so they are never
+        # mistaken for the reply to the command just sent
+        while True:
+            newline = self._recv_buffer.find(b"\n")
+            if newline >= 0:
+                line = self._recv_buffer[:newline].decode("utf-8").strip()
+                del self._recv_buffer[: newline + 1]
+                if not line or line == HEARTBEAT_MESSAGE:
+                    continue
+                if self._unread_responses:
+                    # Reply to an earlier fire-and-forget command
+                    self._unread_responses -= 1
+                    continue
+                return line
+            received = self.socket.recv_into(self._recv_chunk)
+            if not received:
+                raise ConnectionResetError("Connection closed by target")
+            self._recv_buffer += memoryview(self._recv_chunk)[:received]
 
     def send_command(self, command: str, wait_response: bool = True) -> Optional[str]:
-        with self._connection_lock:
-            if not self.connected:
-                logger.warning("TCP client not connected")
-                if not self.connect():
+        # A stale session (target restarted, link dropped while idle) is only
+        # detected when it is used, so reconnect once and retry before failing
+        for attempt in range(2):
+            with self._lock:
+                if not self._ensure_connected():
                     return None
 
-        with self._socket_lock:
-            if not self.socket:
-                logger.warning("TCP socket not available")
-                return None
+                try:
+                    self.socket.sendall(_encode_command(command))
+                    logger.debug("TCP command sent: %s", command)
 
-            try:
-                message = command.strip() + "\n"
-                self.socket.send(message.encode("utf-8"))
-                logger.debug(f"TCP command sent: {command}")
-
-                if wait_response:
-                    self.socket.settimeout(self.receive_timeout)
-                    response = self.socket.recv(1024).decode("utf-8").strip()
-                    logger.debug(f"TCP response received: {response}")
-                    return response
-                return None
-            except Exception as e:
-                logger.error(f"TCP send failed: {e}")
-                with self._connection_lock:
+                    if wait_response:
+                        response = self._read_response()
+                        logger.debug("TCP response received: %s", response)
+                        return response
+                    # The target still replies; drop that line on the next read
+                    # instead of blocking on it now
+                    self._unread_responses += 1
+                    return None
+                except socket.timeout:
+                    # The command may already have been applied, so don't resend.
+                    # Its reply may arrive late or never, so drop the session
+                    # rather than guess which later line belongs to which command;
+                    # the next send reconnects
+                    logger.error("TCP response timeout for command: %s", command)
+                    self._close_socket()
+                    self._recv_buffer.clear()
+                    self._unread_responses = 0
+                    return None
+                except Exception as e:
+                    logger.error("TCP send failed: %s", e)
                     self.connected = False
-                return None
+                    self._recv_buffer.clear()
+                    self._unread_responses = 0
+
+            if attempt == 0:
+                logger.info("Reconnecting TCP session and retrying command")
+        return None
 
     def is_connected(self) -> bool:
-        with self._connection_lock:
-            with self._socket_lock:
-                return self.connected and self.socket is not None
+        with self._lock:
+            return self.connected and self.socket is not None
 
     def __enter__(self):
         self.connect()
@@ -1,5 +1,6 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from sensor_object import SensorObject
+import functools
 import threading
 import json
 import logging
@@ -7,6 +8,45 @@ import logging
 logger = logging.getLogger("UDPClientObject")
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_pressure_reading(data: str) -> Optional[Tuple[int, str]]:
+    # Readings repeat constantly while the pressure is steady, so identical
+    # packets are parsed once and served from the cache afterwards
+    try:
+        # Extract sensor ID from format: PRESSURE_SENSOR_1_VALUE:...
+        sensor_id_match = data.split("_VALUE:")[0].replace("PRESSURE_SENSOR_", "")
+        sensor_id = int(sensor_id_match)
+
+        # Parse the value part: 123.456|TC1|TC Gauge 1|0.050000 Torr
+        value_part = data.split("_VALUE:")[1]
+        parts = value_part.split("|")
+        pressure_value = float(parts[0])  # First part is numeric value in mTorr
+
+        # Get formatted value (last part should have units)
+        if len(parts) >= 4:
+            formatted_value = parts[3]  # Last part is formatted string with units
+        elif len(parts) >= 1:
+            # Fallback: convert mTorr to Torr and add units
+            pressure_torr = pressure_value / 1000.0
+            formatted_value = f"{pressure_torr:.6f} Torr"
+        else:
+            formatted_value = "---"
+
+        # Ensure units are present
+        if "Torr" not in formatted_value and "mTorr" not in formatted_value and formatted_value != "---":
+            # If no units found, assume it's in mTorr and convert to Torr
+            try:
+                pressure_torr = float(formatted_value) / 1000.0
+                formatted_value = f"{pressure_torr:.6f} Torr"
+            except (ValueError, TypeError):
+                formatted_value = f"{pressure_value / 1000.0:.6f} Torr"
+
+        return sensor_id, formatted_value
+    except (ValueError, IndexError) as e:
+        logger.debug(f"UDP Client Object: Error parsing PRESSURE_SENSOR format: {e}")
+        return None
+
+
 class UDPClientObject:
     def __init__(self, sensor_registry: Dict[str, SensorObject]):
         self.sensor_registry = sensor_registry
@@ -14,100 +54,87 @@ class UDPClientObject:
 
     def process_received_data(self, data: str) -> Optional[str]:
         try:
-            payload = json.loads(data)
-            identifier = (
-                payload.get("id") or payload.get("name") or payload.get("identifier")
+            # Only JSON objects start with "{"; the PRESSURE_SENSOR_X_VALUE and
+            # "identifier:value" lines that make up most traffic would just
+            # raise out of json.loads, so skip the decode for them
+            if data.lstrip().startswith("{"):
+                try:
+                    return self._process_json_payload(json.loads(data))
+                except json.JSONDecodeError:
+                    pass
+            return self._process_text_data(data)
+        except Exception as e:
+            logger.error(f"UDP Client Object error processing data: {e}")
+            return None
+
+    def _process_json_payload(self, payload: dict) -> Optional[str]:
+        identifier = (
+            payload.get("id") or payload.get("name") or payload.get("identifier")
+        )
+        value = payload.get("value")
+
+        if identifier and value is not None:
+            matched = self._match_identifier(identifier, value)
+            if matched:
+                return matched
+
+            logger.debug(
+                "UDP Client Object: No sensor match for identifier '%s'", identifier
             )
-            value = payload.get("value")
 
-            if identifier and value is not None:
+        return None
+
+    def _process_text_data(self, data: str) -> Optional[str]:
+        # Handle PRESSURE_SENSOR_X_VALUE format: PRESSURE_SENSOR_1_VALUE:123.456|TC1|TC Gauge 1|123.46 mTorr
+        if data.startswith("PRESSURE_SENSOR_") and "_VALUE:" in data:
+            reading = _parse_pressure_reading(data)
+            if reading is not None:
+                sensor_id, formatted_value = reading
+                sensor_key = f"pressure_sensor_{sensor_id}"
+
                 with self._registry_lock:
-                    for sensor_name, sensor in self.sensor_registry.items():
-                        if (
-                            identifier == sensor.name
-                            or identifier.lower() in sensor.name.lower()
-                            or sensor.name.lower() in identifier.lower()
-                        ):
-                            sensor.update_value(value)
-                            logger.debug(
-                                f"UDP Client Object: Matched identifier '{identifier}' to sensor '{sensor.name}', updated value to {value}"
-                            )
-                            return sensor_name
-
-                logger.debug(
-                    f"UDP Client Object: No sensor match for identifier '{identifier}'"
-                )
+                    sensor = self.sensor_registry.get(sensor_key)
+                    if sensor:
+                        # Store the formatted value string for display
+                        sensor.update_value(formatted_value)
+                        logger.debug(
+                            "UDP Client Object: Matched PRESSURE_SENSOR_%s to sensor '%s', updated value to %s",
+                            sensor_id,
+                            sensor.name,
+                            formatted_value,
+                        )
+                        return sensor_key
 
-            return None
-        except json.JSONDecodeError:
-            # Handle PRESSURE_SENSOR_X_VALUE format: PRESSURE_SENSOR_1_VALUE:123.456|TC1|TC Gauge 1|123.46 mTorr
-            if data.startswith("PRESSURE_SENSOR_") and "_VALUE:" in data:
+        # Handle simple "identifier:value" format
+        if ":" in data:
+            parts = data.split(":", 1)
+            if len(parts) == 2:
+                identifier = parts[0].strip()
                 try:
-                    # Extract sensor ID from format: PRESSURE_SENSOR_1_VALUE:...
-                    sensor_id_match = data.split("_VALUE:")[0].replace("PRESSURE_SENSOR_", "")
-                    sensor_id = int(sensor_id_match)
-                    sensor_key = f"pressure_sensor_{sensor_id}"
-                    
-                    # Parse the value part: 123.456|TC1|TC Gauge 1|0.050000 Torr
-                    value_part = data.split("_VALUE:")[1]
-                    parts = value_part.split("|")
-                    pressure_value = float(parts[0])  # First part is numeric value in mTorr
-                    
-                    # Get formatted value (last part should have units)
-                    if len(parts) >= 4:
-                        formatted_value = parts[3]  # Last part is formatted string with units
-                    elif len(parts) >= 1:
-                        # Fallback: convert mTorr to Torr and add units
-                        pressure_torr = pressure_value / 1000.0
-                        formatted_value = f"{pressure_torr:.6f} Torr"
-                    else:
-                        formatted_value = "---"
-                    
-                    # Ensure units are present
-                    if "Torr" not in formatted_value and "mTorr" not in formatted_value and formatted_value != "---":
-                        # If no units found, assume it's in mTorr and convert to Torr
-                        try:
-                            pressure_torr = float(formatted_value) / 1000.0
-                            formatted_value = f"{pressure_torr:.6f} Torr"
-                        except (ValueError, TypeError):
-                            formatted_value = f"{pressure_value / 1000.0:.6f} Torr"
-                    
-                    with self._registry_lock:
-                        sensor = self.sensor_registry.get(sensor_key)
-                        if sensor:
-                            # Store the formatted value string for display
-                            sensor.update_value(formatted_value)
-                            logger.debug(
-                                f"UDP Client Object: Matched PRESSURE_SENSOR_{sensor_id} to sensor '{sensor.name}', updated value to {formatted_value}"
-                            )
-                            return sensor_key
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"UDP Client Object: Error parsing PRESSURE_SENSOR format: {e}")
-            
-            # Handle simple "identifier:value" format
-            if ":" in data:
-                parts = data.split(":", 1)
-                if len(parts) == 2:
-                    identifier = parts[0].strip()
-                    try:
-                        value = float(parts[1].strip())
-                        with self._registry_lock:
-                            for sensor_name, sensor in self.sensor_registry.items():
-                                if (
-                                    identifier == sensor.name
-                                    or identifier.lower() in sensor.name.lower()
-                                    or sensor.name.lower() in identifier.lower()
-                                ):
-                                    sensor.update_value(value)
-                                    logger.debug(
-                                        f"UDP Client Object: Matched identifier '{identifier}' to sensor '{sensor.name}', updated value to {value}"
-                                    )
-                                    return sensor_name
-                    except ValueError:
-                        pass
-
-            logger.debug(f"UDP Client Object: Could not parse data: {data}")
-            return None
-        except Exception as e:
-            logger.error(f"UDP Client Object error processing data: {e}")
-            return None
+                    value = float(parts[1].strip())
+                    matched = self._match_identifier(identifier, value)
+                    if matched:
+                        return matched
+                except ValueError:
+                    pass
+
+        logger.debug("UDP Client Object: Could not parse data: %s", data)
+        return None
+
+    def _match_identifier(self, identifier: str, value) -> Optional[str]:
+        with self._registry_lock:
+            for sensor_name, sensor in self.sensor_registry.items():
+                if (
+                    identifier == sensor.name
+                    or identifier.lower() in sensor.name.lower()
+                    or sensor.name.lower() in identifier.lower()
+                ):
+                    sensor.update_value(value)
+                    logger.debug(
+                        "UDP Client Object: Matched identifier '%s' to sensor '%s', updated value to %s",
+                        identifier,
+                        sensor.name,
+                        value,
+                    )
+                    return sensor_name
+        return None
@@ -1,3 +1,4 @@
+import select
 import socket
 import threading
 import logging
@@ -5,6 +6,14 @@ from typing import Optional, Callable
 
 logger = logging.getLogger("UDPDataClient")
 
+# One datagram per read; sized so periodic packets with every ADC channel and
+# pressure reading are never truncated
+UDP_RECV_BUFFER_SIZE = 4096
+# How long the receive loop waits for data before re-checking for stop (s)
+UDP_SELECT_TIMEOUT = 1.0
+# Most datagrams handled per wakeup before the stop flag is checked again
+UDP_DRAIN_MAX = 64
+
 
 class UDPDataClient:
     def __init__(
@@ -38,7 +47,8 @@ class UDPDataClient:
             try:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 self.socket.bind(("0.0.0.0", self.target_port))
-                self.socket.settimeout(1.0)
+                # Non-blocking so a wakeup can drain everything already queued
+                self.socket.setblocking(False)
 
                 self.running = True
                 self.receiver_thread = threading.Thread(
@@ -54,6 +64,9 @@ class UDPDataClient:
 
     def _receive_loop(self):
         logger.info("UDP data receive loop started")
+        # Datagrams land in one reused buffer instead of a new bytes per packet
+        buffer = bytearray(UDP_RECV_BUFFER_SIZE)
+        view = memoryview(buffer)
 
         while True:
             with self._running_lock:
@@ -61,21 +74,28 @@ class UDPDataClient:
                     break
 
             try:
-                data, address = self.socket.recvfrom(1024)
-                message = data.decode("utf-8").strip()
-
-                if message:
-                    logger.debug(f"Received data from {address}: {message}")
-
-                    callback = None
-                    with self._callback_lock:
-                        callback = self.data_callback
-
-                    if callback:
-                        callback(message)
+                readable, _, _ = select.select(
+                    (self.socket,), (), (), UDP_SELECT_TIMEOUT
+                )
+                if not readable:
+                    continue
+
+                with self._callback_lock:
+                    callback = self.data_callback
+
+                # Handle a burst of datagrams in one pass rather than going
+                # back through select and both locks for each of them
+                for _ in range(UDP_DRAIN_MAX):
+                    try:
+                        size, address = self.socket.recvfrom_into(buffer)
+                    except BlockingIOError:
+                        break
+                    message = str(view[:size], "utf-8").strip()
+                    if message:
+                        logger.debug("Received data from %s: %s", address, message)
+                        if callback:
+                            callback(message)
 
-            except socket.timeout:
-                continue
             except Exception as e:
                 with self._running_lock:
                     if self.running:
@@ -1,3 +1,4 @@
+import select
 import socket
 import threading
 import logging
@@ -6,6 +7,14 @@ from typing import Optional, Callable
 # Setup logging for this module
 logger = logging.getLogger("UDPStatusClient")
 
+# One datagram per read; sized so periodic packets with every ADC channel and
+# pressure reading are never truncated
+UDP_RECV_BUFFER_SIZE = 4096
+# How long the receive loop waits for data before re-checking for stop (s)
+UDP_SELECT_TIMEOUT = 1.0
+# Most datagrams handled per wakeup before the stop flag is checked again
+UDP_DRAIN_MAX = 64
+
 
 class UDPStatusClient:
     def __init__(self, target_ip: str = "192.168.0.2", target_port: int = 8889):
@@ -30,7 +39,7 @@ class UDPStatusClient:
         try:
             message = status.encode("utf-8")
             self.socket.sendto(message, (self.target_ip, self.target_port))
-            logger.debug(f"UDP status sent: {status}")
+            logger.debug("UDP status sent: %s", status)
             return True
         except Exception as e:
             logger.error(f"UDP send failed: {e}")
@@ -71,7 +80,8 @@ class UDPStatusReceiver:
             try:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 self.socket.bind(("0.0.0.0", self.listen_port))
-                self.socket.settimeout(1.0)
+                # Non-blocking so a wakeup can drain everything already queued
+                self.socket.setblocking(False)
 
                 self.running = True
                 self.receiver_thread = threading.Thread(
@@ -86,6 +96,9 @@ class UDPStatusReceiver:
 
     def _receive_loop(self):
         logger.info("UDP receive loop started")
+        # Datagrams land in one reused buffer instead of a new bytes per packet
+        buffer = bytearray(UDP_RECV_BUFFER_SIZE)
+        view = memoryview(buffer)
 
         while True:
             with self._running_lock:
@@ -93,19 +106,27 @@ class UDPStatusReceiver:
                     break
 
             try:
-                data, address = self.socket.recvfrom(1024)
-                message = data.decode("utf-8").strip()
-                logger.debug(f"UDP message received from {address}: {message}")
+                readable, _, _ = select.select(
+                    (self.socket,), (), (), UDP_SELECT_TIMEOUT
+                )
+                if not readable:
+                    continue
 
-                callback = None
                 with self._callback_lock:
                     callback = self.callback
 
-                if callback:
-                    callback(message, address)
+                # Handle a burst of datagrams in one pass rather than going
+                # back through select and both locks for each of them
+                for _ in range(UDP_DRAIN_MAX):
+                    try:
+                        size, address = self.socket.recvfrom_into(buffer)
+                    except BlockingIOError:
+                        break
+                    message = str(view[:size], "utf-8").strip()
+                    logger.debug("UDP message received from %s: %s", address, message)
+                    if callback:
+                        callback(message, address)
 
-            except socket.timeout:
-                continue
             except Exception as e:
                 with self._running_lock:
                     if self.running:
@@ -21,6 +21,8 @@ VALVE_ANALOG_LABELS: Dict[int, str] = {
     6: "RESERVED_VALVE_6",
 }
 
+BATCH_SEPARATOR = ";"
+
 
 
 class CommandProcessor:
@@ -175,6 +177,23 @@ class CommandProcessor:
         self._send_status_update(f"Motor object created: {component_name} -> {motor_degree}° (from {percentage}%)")
         return True, motor_object, None
 
+    def _process_batch(self, batch: str) -> str:
+        """Run each command of a BATCH frame in order and join their responses."""
+        commands = [cmd.strip() for cmd in batch.split(BATCH_SEPARATOR) if cmd.strip()]
+        if not commands:
+            error_msg = "BATCH_FAILED: No commands in batch"
+            self._send_status_update(error_msg)
+            return error_msg
+
+        logger.info(f"Processing batch of {len(commands)} commands from host")
+        responses = []
+        for cmd in commands:
+            if cmd.startswith("BATCH:"):
+                responses.append("ERROR: Nested BATCH not allowed")
+            else:
+                responses.append(self.process_command(cmd))
+        return BATCH_SEPARATOR.join(responses)
+
     def process_command(self, command: str) -> str:
         if not command:
             error_msg = "ERROR: Empty command"
@@ -182,6 +201,10 @@ class CommandProcessor:
             return error_msg
 
         command = command.strip().upper()
+
+        if command.startswith("BATCH:"):
+            return self._process_batch(command[6:])
+
         logger.info(f"Processing command from host: {command}")
         self._send_status_update(f"Processing command: {command}")
 
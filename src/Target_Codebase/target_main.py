@@ -5,6 +5,7 @@ import time
 import argparse
 import signal
 import sys
+from collections import deque
 from tcp_command_server import TCPCommandServer
 from udp_data_server import UDPDataServer
 from udp_status_server import UDPStatusSender, UDPStatusReceiver
@@ -20,6 +21,19 @@ PRESSURE_SENSOR_CHANNELS = {
     3: {"channel": 2, "name": "Manometer 1", "label": "M1", "min_pressure_mtorr": 0.1, "max_pressure_torr": 760.0},
 }
 
+# Flattened once so the periodic packet doesn't walk the nested dicts every
+# tick: (key prefix, channel, min mTorr, mTorr span, "|label|name|" suffix)
+PRESSURE_SENSOR_CONVERSIONS = tuple(
+    (
+        f"PRESSURE_SENSOR_{sensor_id}_VALUE:",
+        info["channel"],
+        info["min_pressure_mtorr"],
+        info["max_pressure_torr"] * 1000.0 - info["min_pressure_mtorr"],
+        f"|{info['label']}|{info['name']}|",
+    )
+    for sensor_id, info in PRESSURE_SENSOR_CHANNELS.items()
+)
+
 # Setup logging first
 setup_logging()
 logger = get_logger("TargetMain")
@@ -96,7 +110,12 @@ class TargetSystem:
         self.running = False
 
         self.adc_filter_size = 10
-        self.adc_readings_buffers = [[] for _ in range(8)]
+        # Moving-average window per channel, with a running sum so each sample
+        # costs O(1) instead of re-summing (and shifting) the whole window
+        self.adc_readings_buffers = [
+            deque(maxlen=self.adc_filter_size) for _ in range(8)
+        ]
+        self.adc_readings_sums = [0] * 8
         self.adc_last_reported_values = [None] * 8
         self.adc_noise_threshold = 0
         self.adc_floating_threshold = 200
@@ -150,19 +169,22 @@ class TargetSystem:
                         
                         with self._adc_lock:
                             adc_value_list = []
+                            filtered_values = [0] * 8
+                            buffers = self.adc_readings_buffers
+                            sums = self.adc_readings_sums
                             for channel in range(8):
                                 raw_value = all_adc_values[channel]
                                 
-                                self.adc_readings_buffers[channel].append(raw_value)
-                                if len(self.adc_readings_buffers[channel]) > self.adc_filter_size:
-                                    self.adc_readings_buffers[channel].pop(0)
+                                buffer = buffers[channel]
+                                if len(buffer) == buffer.maxlen:
+                                    sums[channel] -= buffer[0]
+                                buffer.append(raw_value)
+                                sums[channel] += raw_value
                                 
                                 filtered_value = raw_value
-                                if len(self.adc_readings_buffers[channel]) >= 3:
-                                    filtered_value = int(
-                                        sum(self.adc_readings_buffers[channel])
-                                        / len(self.adc_readings_buffers[channel])
-                                    )
+                                if len(buffer) >= 3:
+                                    filtered_value = int(sums[channel] / len(buffer))
+                                filtered_values[channel] = filtered_value
                                 
                                 if channel >= 3:
                                     if filtered_value <= 5:
@@ -179,31 +201,20 @@ class TargetSystem:
                             
                             data_parts.append(f"ADC_DATA:{','.join(adc_value_list)}")
                             
-                            for sensor_id, sensor_info in PRESSURE_SENSOR_CHANNELS.items():
-                                channel = sensor_info["channel"]
+                            for (
+                                key_prefix,
+                                channel,
+                                min_pressure_mtorr,
+                                span_mtorr,
+                                label_suffix,
+                            ) in PRESSURE_SENSOR_CONVERSIONS:
                                 if channel < len(all_adc_values):
-                                    adc_value = all_adc_values[channel]
-                                    
-                                    if len(self.adc_readings_buffers[channel]) >= 3:
-                                        filtered_adc = int(
-                                            sum(self.adc_readings_buffers[channel])
-                                            / len(self.adc_readings_buffers[channel])
-                                        )
-                                    else:
-                                        filtered_adc = adc_value
-                                    
-                                    voltage = (filtered_adc / 1023.0) * 5.0
-                                    min_pressure_mtorr = sensor_info["min_pressure_mtorr"]
-                                    max_pressure_torr = sensor_info["max_pressure_torr"]
-                                    max_pressure_mtorr = max_pressure_torr * 1000.0
-                                    pressure_mtorr = min_pressure_mtorr + (voltage / 5.0) * (max_pressure_mtorr - min_pressure_mtorr)
-                                    
+                                    voltage = (filtered_values[channel] / 1023.0) * 5.0
+                                    pressure_mtorr = min_pressure_mtorr + (voltage / 5.0) * span_mtorr
                                     pressure_torr = pressure_mtorr / 1000.0
-                                    pressure_formatted = f"{pressure_torr:.6f} Torr"
-                                    
-                                    sensor_label = sensor_info["label"]
-                                    sensor_name = sensor_info["name"]
-                                    data_parts.append(f"PRESSURE_SENSOR_{sensor_id}_VALUE:{pressure_mtorr:.3f}|{sensor_label}|{sensor_name}|{pressure_formatted}")
+                                    data_parts.append(
+                                        f"{key_prefix}{pressure_mtorr:.3f}{label_suffix}{pressure_torr:.6f} Torr"
+                                    )
                             
                     except Exception as e:
                         logger.error(f"Error reading ADC channels: {e}", exc_info=True)
@@ -11,6 +11,14 @@ from command_processor import CommandProcessor
 setup_logging()
 logger = get_logger("TCPCommandServer")
 
+# Read as much as the host has queued in one call instead of 1 KiB at a time
+RECV_BUFFER_SIZE = 65536
+# Idle time before a session sends a heartbeat (seconds)
+SESSION_TIMEOUT = 30
+# Longest command accepted without its newline terminator
+MAX_COMMAND_LENGTH = 4096
+UNTERMINATED_COMMAND_ERROR = "ERROR: Command must end with a newline"
+
 
 class TCPCommandServer:
     def __init__(
@@ -55,30 +63,66 @@ class TCPCommandServer:
         logger.info(f"TCP session started with {client_address}")
 
         try:
-            client_socket.settimeout(30)  # 30 second timeout for commands
-
+            client_socket.settimeout(SESSION_TIMEOUT)
+            # Send each response as soon as it is written instead of waiting on Nagle
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            # Commands are newline-terminated; one read can carry several of
+            # them (or part of one), so frame them from a running buffer
+            pending = bytearray()
+            # Receive straight into one reused buffer rather than allocating
+            # a fresh bytes object per read
+            chunk = bytearray(RECV_BUFFER_SIZE)
+            chunk_view = memoryview(chunk)
             while True:
                 with self._running_lock:
                     if not self.running:
                         break
                 try:
-                    # Receive command from client
-                    data = client_socket.recv(1024)
-                    if not data:
+                    received = client_socket.recv_into(chunk)
+                    if not received:
                         break
-
-                    # Process command
-                    command = data.decode("utf-8").strip()
-                    response = self._handle_command(command)
-
-                    # Send response back
-                    client_socket.send((response + "\n").encode("utf-8"))
-                    logger.debug(f"Sent response: {response}")
+                    pending += chunk_view[:received]
+
+                    responses = []
+                    newline = pending.find(b"\n")
+                    while newline >= 0:
+                        command = pending[:newline].decode("utf-8").strip()
+                        del pending[: newline + 1]
+                        if command:
+                            responses.append(self._handle_command(command))
+                        newline = pending.find(b"\n")
+
+                    if len(pending) > MAX_COMMAND_LENGTH:
+                        # No command is this long; the sender is not framing
+                        # with newlines, so reject it rather than buffer forever
+                        logger.warning(
+                            f"Dropping {len(pending)} unterminated bytes from {client_address}"
+                        )
+                        pending.clear()
+                        responses.append(UNTERMINATED_COMMAND_ERROR)
+
+                    # Answer everything from this read with a single send
+                    if responses:
+                        client_socket.sendall(
+                            "".join(r + "\n" for r in responses).encode("utf-8")
+                        )
+                        logger.debug(f"Sent responses: {responses}")
 
                 except socket.timeout:
+                    # A partial command that sat through the whole idle period
+                    # will never be completed; tell the sender instead of
+                    # leaving it waiting on a reply
+                    reply = "HEARTBEAT"
+                    if pending.strip():
+                        logger.warning(
+                            f"Dropping unterminated command from {client_address}"
+                        )
+                        reply = UNTERMINATED_COMMAND_ERROR
+                    pending.clear()
                     # Send heartbeat to keep connection alive
                     try:
-                        client_socket.send("HEARTBEAT\n".encode("utf-8"))
+                        client_socket.sendall((reply + "\n").encode("utf-8"))
                     except:
                         break
                     continue
@@ -15,6 +15,8 @@ suite = unittest.TestSuite()
 
 test_modules = [
     "test_host_main",
+    "test_tcp_command_client",
+    "test_control_system",
 ]
 
 for module_name in test_modules:
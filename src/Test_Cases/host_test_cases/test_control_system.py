@@ -0,0 +1,144 @@
+"""
+Unit tests for the control system manager
+Tests PID scheduling on the shared manager thread
+"""
+
+import unittest
+import threading
+import time
+import sys
+import os
+
+host_codebase_path = os.path.join(
+    os.path.dirname(__file__), "..", "..", "Host_Codebase"
+)
+sys.path.insert(0, host_codebase_path)
+
+from control_system import ControlSystemManager
+
+
+class RecordingPID:
+    """Stands in for a PID; records when the manager ticks it"""
+
+    def __init__(self, name, sample_time, ticks):
+        self.name = name
+        self.sample_time = sample_time
+        self.enabled = False
+        self._ticks = ticks
+
+    def disable(self):
+        self.enabled = False
+
+    def _tick(self, now):
+        self._ticks.append((self.name, now))
+
+
+class TestControlSystemManager(unittest.TestCase):
+    def setUp(self):
+        self.ticks = []
+        self.manager = ControlSystemManager()
+
+    def tearDown(self):
+        self.manager.disable()
+        self.manager.thread.join(timeout=1)
+
+    def _add_pid(self, name, sample_time):
+        pid = RecordingPID(name, sample_time, self.ticks)
+        self.manager.add_pid(name, pid)
+        return pid
+
+    def _tick_times(self, name):
+        return [now for tick_name, now in list(self.ticks) if tick_name == name]
+
+    def test_pids_tick_at_their_own_sample_time(self):
+        self._add_pid("fast", 0.02)
+        self._add_pid("slow", 0.1)
+        self.manager.enable_pid("fast")
+        self.manager.enable_pid("slow")
+        time.sleep(0.5)
+
+        fast = self._tick_times("fast")
+        slow = self._tick_times("slow")
+        self.assertGreaterEqual(len(slow), 2)
+        self.assertGreater(len(fast), 2 * len(slow))
+        # The shorter sample time comes due first
+        self.assertEqual(self.ticks[0][0], "fast")
+        for times, sample_time in ((fast, 0.02), (slow, 0.1)):
+            gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+            self.assertGreaterEqual(min(gaps), sample_time * 0.9)
+
+    def test_disable_pid_stops_ticks(self):
+        self._add_pid("loop", 0.02)
+        self.manager.enable_pid("loop")
+        time.sleep(0.1)
+        self.manager.disable_pid("loop")
+        time.sleep(0.05)
+        stopped_at = len(self._tick_times("loop"))
+        time.sleep(0.15)
+
+        self.assertGreater(stopped_at, 0)
+        self.assertEqual(len(self._tick_times("loop")), stopped_at)
+
+    def test_pid_disable_called_directly_stops_ticks(self):
+        pid = self._add_pid("loop", 0.02)
+        self.manager.enable_pid("loop")
+        time.sleep(0.1)
+        pid.disable()
+        time.sleep(0.05)
+        stopped_at = len(self._tick_times("loop"))
+        time.sleep(0.15)
+
+        self.assertEqual(len(self._tick_times("loop")), stopped_at)
+
+    def test_reenable_drops_stale_schedule_entry(self):
+        self._add_pid("loop", 0.05)
+        self.manager.enable_pid("loop")
+        self.manager.disable_pid("loop")
+        self.manager.enable_pid("loop")
+        time.sleep(0.5)
+
+        # A surviving entry from the first enable would double the rate
+        self.assertLessEqual(len(self._tick_times("loop")), 12)
+        with self.manager._schedule_lock:
+            generation = self.manager._pid_generations["loop"]
+            entries = [
+                entry for entry in self.manager._schedule if entry[2] == "loop"
+            ]
+        self.assertTrue(all(entry[3] == generation for entry in entries))
+
+    def test_enable_pid_twice_schedules_once(self):
+        self._add_pid("loop", 0.05)
+        self.manager.enable_pid("loop")
+        self.manager.enable_pid("loop")
+        time.sleep(0.5)
+
+        self.assertLessEqual(len(self._tick_times("loop")), 12)
+
+    def test_disable_stops_manager_thread(self):
+        self._add_pid("loop", 0.02)
+        self.manager.enable_pid("loop")
+        self.manager.disable()
+        self.manager.thread.join(timeout=1)
+
+        self.assertFalse(self.manager.thread.is_alive())
+        self.assertFalse(self.manager.enabled)
+        ticks = len(self.ticks)
+        time.sleep(0.1)
+        self.assertEqual(len(self.ticks), ticks)
+
+    def test_enabled_false_stops_manager_thread(self):
+        self.assertTrue(self.manager.enabled)
+        self.manager.enabled = False
+        self.manager.thread.join(timeout=1)
+
+        self.assertFalse(self.manager.thread.is_alive())
+
+    def test_cannot_restart_after_stop(self):
+        self.manager.disable()
+        with self.assertRaises(RuntimeError):
+            self.manager.enabled = True
+        self.manager.enabled = False
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -64,6 +64,8 @@ from host_main import (
     TelemetryToEventMapper,
     _build_actuator_command,
 )
+from command_handler import CommandHandler
+from auto_controller import _transition_table
 
 
 class TestBuildActuatorCommand(unittest.TestCase):
@@ -87,6 +89,32 @@ class TestBuildActuatorCommand(unittest.TestCase):
         self.assertEqual(result, "")
 
 
+class TestBuildBatchCommand(unittest.TestCase):
+    def test_commands_joined_in_order(self):
+        self.assertEqual(
+            CommandHandler.build_batch_command(["POWER_SUPPLY_ENABLE", "SET_VALVE1:75"]),
+            "BATCH:POWER_SUPPLY_ENABLE;SET_VALVE1:75",
+        )
+
+    def test_blank_commands_dropped(self):
+        self.assertEqual(
+            CommandHandler.build_batch_command([" SET_VALVE1:0 ", "", None, "  "]),
+            "BATCH:SET_VALVE1:0",
+        )
+        self.assertIsNone(CommandHandler.build_batch_command([]))
+
+    def test_separator_in_command_rejected(self):
+        self.assertIsNone(
+            CommandHandler.build_batch_command(["SET_VALVE1:0;SET_VALVE2:0"])
+        )
+
+    def test_nested_batch_rejected(self):
+        self.assertIsNone(
+            CommandHandler.build_batch_command(["BATCH:SET_VALVE1:0", "STATUS"])
+        )
+        self.assertIsNone(CommandHandler.build_batch_command(["batch:STATUS"]))
+
+
 class TestAutoController(unittest.TestCase):
     def setUp(self):
         self.mock_actuators = {
@@ -112,7 +140,7 @@ class TestAutoController(unittest.TestCase):
         self.assertEqual(self.controller.currentState, State.ALL_OFF)
 
     def test_enter_all_off(self):
-        self.controller._enter_all_off()
+        self.controller._apply_state(State.ALL_OFF)
         self.mock_actuators["power_supply"].setAnalogValue.assert_called()
 
     def test_set_voltage_kv(self):
@@ -124,6 +152,120 @@ class TestAutoController(unittest.TestCase):
         self.controller.dispatch_event(Event.STOP_CMD)
         self.assertEqual(self.controller.currentState, State.ALL_OFF)
 
+    def test_transition_table_rejects_missing_stop(self):
+        fsm = dict(AutoController.FSM)
+        del fsm[(State.VENTING_ATM, Event.STOP_CMD)]
+        with self.assertRaises(ValueError):
+            _transition_table(fsm)
+
+    def test_transition_table_rejects_dead_end_state(self):
+        fsm = {
+            key: next_state
+            for key, next_state in AutoController.FSM.items()
+            if key[0] != State.VENTING_ATM
+        }
+        with self.assertRaises(ValueError):
+            _transition_table(fsm)
+
+
+ALL_OFF_COMMANDS = [
+    "SET_VALVE1:0",
+    "SET_MECHANICAL_PUMP:0",
+    "SET_TURBO_PUMP:0",
+    "SET_VALVE2:0",
+    "SET_VALVE3:0",
+    "SET_VALVE4:0",
+    "SET_VOLTAGE:0",
+    "POWER_SUPPLY_DISABLE",
+]
+
+
+class TestAutoControllerCommands(unittest.TestCase):
+    def setUp(self):
+        self.send_command = MagicMock()
+        self.controller = AutoController(
+            {},
+            command_handler=CommandHandler(),
+            send_command_callback=self.send_command,
+        )
+
+    def _sent_on(self, event):
+        self.send_command.reset_mock()
+        self.controller.dispatch_event(event)
+        return [c.args[0] for c in self.send_command.call_args_list]
+
+    def test_initial_all_off_sent_in_full(self):
+        sent = [c.args[0] for c in self.send_command.call_args_list]
+        self.assertEqual(sent, ALL_OFF_COMMANDS)
+
+    def test_first_state_after_all_off_sent_in_full(self):
+        self.assertEqual(
+            self._sent_on(Event.START),
+            [
+                "SET_VALVE1:0",
+                "SET_MECHANICAL_PUMP:100",
+                "SET_TURBO_PUMP:0",
+                "SET_VALVE2:100",
+                "SET_VALVE3:0",
+                "SET_VALVE4:0",
+                "SET_VOLTAGE:0",
+                "POWER_SUPPLY_DISABLE",
+            ],
+        )
+
+    def test_unchanged_outputs_send_nothing(self):
+        self.controller.dispatch_event(Event.START)
+        self.assertEqual(self._sent_on(Event.APS_FORELINE_LT_100MT), [])
+        self.assertEqual(self.controller.currentState, State.RP_DOWN_TURBO)
+
+    def test_only_changed_outputs_sent(self):
+        self.controller.dispatch_event(Event.START)
+        self.controller.dispatch_event(Event.APS_FORELINE_LT_100MT)
+        self.assertEqual(
+            self._sent_on(Event.APS_TURBO_LT_100MT), ["SET_TURBO_PUMP:100"]
+        )
+        self.assertEqual(
+            self._sent_on(Event.APS_TURBO_LT_0_1MT), ["SET_VALVE3:100"]
+        )
+
+    def test_all_off_always_sent_in_full(self):
+        self.controller.dispatch_event(Event.START)
+        self.controller.dispatch_event(Event.APS_FORELINE_LT_100MT)
+        self.assertEqual(self._sent_on(Event.STOP_CMD), ALL_OFF_COMMANDS)
+        # The next run starts from scratch rather than diffing against ALL_OFF
+        self.assertEqual(len(self._sent_on(Event.START)), len(ALL_OFF_COMMANDS))
+
+
+class TestAutoControllerBatch(unittest.TestCase):
+    def setUp(self):
+        self.send_command = MagicMock()
+        self.send_batch = MagicMock()
+        self.controller = AutoController(
+            {},
+            command_handler=CommandHandler(),
+            send_command_callback=self.send_command,
+            send_batch_callback=self.send_batch,
+        )
+
+    def test_multi_command_change_sent_as_one_batch(self):
+        self.send_batch.assert_called_once_with(ALL_OFF_COMMANDS)
+        self.send_command.assert_not_called()
+
+    def test_single_command_change_uses_send_command(self):
+        self.controller.dispatch_event(Event.START)
+        self.controller.dispatch_event(Event.APS_FORELINE_LT_100MT)
+        self.send_batch.reset_mock()
+        self.controller.dispatch_event(Event.APS_TURBO_LT_100MT)
+        self.send_command.assert_called_once_with("SET_TURBO_PUMP:100")
+        self.send_batch.assert_not_called()
+
+    def test_empty_change_sends_nothing(self):
+        self.controller.dispatch_event(Event.START)
+        self.send_batch.reset_mock()
+        self.controller.dispatch_event(Event.APS_FORELINE_LT_100MT)
+        self.send_batch.assert_not_called()
+        self.send_command.assert_not_called()
+
 
 class TestTelemetryToEventMapper(unittest.TestCase):
     def setUp(self):
@@ -303,6 +445,59 @@ class TestFusorHostApp(unittest.TestCase):
             mock_stop.assert_called()
 
 
+
+class TestEmergencyStop(unittest.TestCase):
+    @patch("host_main.TCPCommandClient")
+    @patch("host_main.UDPDataClient")
+    @patch("host_main.UDPStatusClient")
+    @patch("host_main.UDPStatusReceiver")
+    @patch.object(FusorHostApp, "_setup_ui")
+    def setUp(self, mock_setup_ui, mock_status_receiver, mock_status_client, mock_udp_data, mock_tcp):
+        self.mock_tcp_client = MagicMock()
+        self.mock_tcp_client.is_connected.return_value = True
+        self.mock_tcp_client.send_command.return_value = "OK"
+        mock_tcp.return_value = self.mock_tcp_client
+
+        self.app = FusorHostApp(target_ip="127.0.0.1")
+        self.app.root = MagicMock()
+        # Pretend the command worker is running so auto-mode sends are queued
+        self.app._command_thread = MagicMock()
+        for name in (
+            "voltage_scale",
+            "manual_mech_switch",
+            "turbo_pump_switch",
+            "status_label",
+            "auto_log_display",
+        ):
+            setattr(self.app, name, MagicMock())
+        self.app.valve_sliders = {}
+        self.app.valve_value_labels = {}
+        self.app.valve_set_buttons = {}
+
+        timer_patch = patch("auto_controller.threading.Timer")
+        timer_patch.start()
+        self.addCleanup(timer_patch.stop)
+
+    def _sent_commands(self):
+        return [c.args[0] for c in self.mock_tcp_client.send_command.call_args_list]
+
+    def test_stop_batch_is_sent_last(self):
+        self.app.auto_controller._enter_state(State.NOMINAL_27KV)
+        self.app._cancel_pending_commands()
+        self.mock_tcp_client.send_command.reset_mock()
+
+        # NOMINAL_27KV -> DEENERGIZING reopens the fusor valve; that must not
+        # reach the target after the emergency stop has zeroed everything
+        self.app._emergency_stop()
+
+        sent = self._sent_commands()
+        self.assertTrue(any("SET_VALVE3:100" in command for command in sent))
+        self.assertTrue(sent[-1].startswith("BATCH:"))
+        self.assertIn("SET_VALVE3:0", sent[-1])
+        self.assertTrue(sent[-1].endswith("POWER_SUPPLY_DISABLE"))
+        self.assertTrue(self.app._command_queue.empty())
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,83 @@
+"""
+Unit tests for the TCP command client
+Tests request/response pairing over a persistent session
+"""
+
+import unittest
+import socket
+import threading
+import time
+import sys
+import os
+
+host_codebase_path = os.path.join(
+    os.path.dirname(__file__), "..", "..", "Host_Codebase"
+)
+sys.path.insert(0, host_codebase_path)
+
+from tcp_command_client import TCPCommandClient
+
+
+class TestTCPCommandClient(unittest.TestCase):
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.server_thread = threading.Thread(target=self._serve, daemon=True)
+        self.server_thread.start()
+
+        self.client = TCPCommandClient("127.0.0.1", self.port)
+        self.client.receive_timeout = 0.2
+
+    def tearDown(self):
+        self.client.disconnect()
+        self.server.close()
+
+    def _serve(self):
+        # The client reconnects after a timeout, so keep accepting sessions
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        # Echo-style target: replies "<command>_OK", late for SLOW commands
+        # and never for LOST ones
+        try:
+            with conn, conn.makefile("rb") as lines:
+                for line in lines:
+                    command = line.decode("utf-8").strip()
+                    if command == "LOST":
+                        continue
+                    if command == "SLOW":
+                        time.sleep(0.4)
+                    conn.sendall(f"{command}_OK\n".encode("utf-8"))
+        except OSError:
+            pass
+
+    def test_responses_match_commands(self):
+        self.assertEqual(self.client.send_command("A"), "A_OK")
+        self.assertEqual(self.client.send_command("B"), "B_OK")
+
+    def test_late_reply_is_not_taken_for_next_command(self):
+        self.assertIsNone(self.client.send_command("SLOW"))
+        time.sleep(0.3)
+        self.assertEqual(self.client.send_command("NEXT"), "NEXT_OK")
+        self.assertEqual(self.client.send_command("AFTER"), "AFTER_OK")
+
+    def test_lost_reply_does_not_desync_session(self):
+        self.assertIsNone(self.client.send_command("LOST"))
+        self.assertEqual(self.client.send_command("NEXT"), "NEXT_OK")
+        self.assertEqual(self.client.send_command("AFTER"), "AFTER_OK")
+
+    def test_fire_and_forget_reply_is_skipped(self):
+        self.assertIsNone(self.client.send_command("QUIET", wait_response=False))
+        self.assertEqual(self.client.send_command("LOUD"), "LOUD_OK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,10 @@ from test_gpio_handler import TestGPIOHandler
 from test_command_processor import TestCommandProcessor
 from test_adc import TestMCP3008ADC
 from test_tcp_communication import TestTCPCommunication
+from test_tcp_command_server import (
+    TestTCPCommandServerFraming,
+    TestTCPCommandServerIdleTimeout,
+)
 from test_udp_communication import TestUDPCommunication
 
 
@@ -32,6 +36,8 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestCommandProcessor))
     suite.addTests(loader.loadTestsFromTestCase(TestMCP3008ADC))
     suite.addTests(loader.loadTestsFromTestCase(TestTCPCommunication))
+    suite.addTests(loader.loadTestsFromTestCase(TestTCPCommandServerFraming))
+    suite.addTests(loader.loadTestsFromTestCase(TestTCPCommandServerIdleTimeout))
     suite.addTests(loader.loadTestsFromTestCase(TestUDPCommunication))
 
     # Run tests
@@ -162,6 +162,20 @@ class TestCommandProcessor(unittest.TestCase):
         result = self.command_processor.process_command("SET_VOLTAGE:")
         self.assertIn("FAILED", result)
 
+    def test_batch_command(self):
+        """Test BATCH command runs each command and joins the responses"""
+        result = self.command_processor.process_command(
+            "BATCH:POWER_SUPPLY_ENABLE;power_supply_disable"
+        )
+        self.assertEqual(
+            result, "POWER_SUPPLY_ENABLE_SUCCESS;POWER_SUPPLY_DISABLE_SUCCESS"
+        )
+
+    def test_empty_batch_command(self):
+        """Test BATCH command with no commands"""
+        result = self.command_processor.process_command("BATCH:")
+        self.assertIn("BATCH_FAILED", result)
+
 
 if __name__ == "__main__":
     unittest.main()
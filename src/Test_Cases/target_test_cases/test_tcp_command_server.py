@@ -0,0 +1,135 @@
+"""
+Unit tests for the TCP command server
+Tests newline framing of commands within a session
+"""
+
+import unittest
+from unittest.mock import MagicMock
+import socket
+import threading
+import time
+import sys
+import os
+
+# Add Target_Codebase to path to import target codebase modules
+target_codebase_path = os.path.join(
+    os.path.dirname(__file__), "..", "..", "Target_Codebase"
+)
+sys.path.insert(0, target_codebase_path)
+
+# Mock hardware and logging modules before importing (required for non-RPi environments)
+for module_name in (
+    "lgpio",
+    "serial",
+    "serial.tools",
+    "serial.tools.list_ports",
+    "Adafruit_GPIO",
+    "Adafruit_GPIO.SPI",
+    "Adafruit_MCP3008",
+    "logging_setup",
+):
+    sys.modules.setdefault(module_name, MagicMock())
+
+import tcp_command_server
+from tcp_command_server import TCPCommandServer
+
+
+class _SessionTestCase(unittest.TestCase):
+    """Runs one command session against a loopback client"""
+
+    def setUp(self):
+        """Open a loopback session served by _tcp_session_handler"""
+        self.server = TCPCommandServer(bundled_interface=None)
+        self.server.running = True
+        self.server._handle_command = lambda command: f"{command}_OK"
+
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        self.client = socket.create_connection(listener.getsockname())
+        session_socket, address = listener.accept()
+        listener.close()
+
+        self.session_thread = threading.Thread(
+            target=self.server._tcp_session_handler,
+            args=(session_socket, address),
+            daemon=True,
+        )
+        self.session_thread.start()
+        self.client.settimeout(2)
+        self.replies = self.client.makefile("r", encoding="utf-8")
+
+    def tearDown(self):
+        """Close the session"""
+        self.server.running = False
+        self.replies.close()
+        self.client.close()
+        self.session_thread.join(timeout=2)
+
+    def _read_reply(self):
+        return self.replies.readline().strip()
+
+
+class TestTCPCommandServerFraming(_SessionTestCase):
+    """Test cases for splitting the session stream into commands"""
+
+    def test_several_commands_in_one_recv(self):
+        """Test every command in a single segment gets its own reply, in order"""
+        self.client.sendall(b"A\nB\nC\n")
+        self.assertEqual(
+            [self._read_reply() for _ in range(3)], ["A_OK", "B_OK", "C_OK"]
+        )
+
+    def test_command_split_across_recvs(self):
+        """Test a command is only handled once its newline arrives"""
+        self.client.sendall(b"SET_VAL")
+        time.sleep(0.1)
+        self.client.sendall(b"VE1:50\n")
+        self.assertEqual(self._read_reply(), "SET_VALVE1:50_OK")
+
+    def test_leftover_bytes_wait_for_terminator(self):
+        """Test a trailing partial command is held until it is completed"""
+        self.client.sendall(b"A\nB")
+        self.assertEqual(self._read_reply(), "A_OK")
+        self.client.settimeout(0.2)
+        with self.assertRaises(socket.timeout):
+            self.client.recv(1)
+        self.client.settimeout(2)
+        self.client.sendall(b"\n")
+        self.assertEqual(self._read_reply(), "B_OK")
+
+    def test_overlong_unterminated_command_is_rejected(self):
+        """Test data with no newline past the length limit gets an error"""
+        self.client.sendall(b"X" * (tcp_command_server.MAX_COMMAND_LENGTH + 1))
+        self.assertEqual(
+            self._read_reply(), tcp_command_server.UNTERMINATED_COMMAND_ERROR
+        )
+        self.client.sendall(b"A\n")
+        self.assertEqual(self._read_reply(), "A_OK")
+
+
+class TestTCPCommandServerIdleTimeout(_SessionTestCase):
+    """Test cases for unterminated commands left when a session goes idle"""
+
+    def setUp(self):
+        """Shorten the session timeout so the idle path runs quickly"""
+        self.saved_timeout = tcp_command_server.SESSION_TIMEOUT
+        tcp_command_server.SESSION_TIMEOUT = 0.2
+        super().setUp()
+
+    def tearDown(self):
+        """Restore the session timeout"""
+        super().tearDown()
+        tcp_command_server.SESSION_TIMEOUT = self.saved_timeout
+
+    def test_unterminated_command_gets_error_when_idle(self):
+        """Test an old-style command without a newline is answered with an error"""
+        self.client.sendall(b"STATUS")
+        self.assertEqual(
+            self._read_reply(), tcp_command_server.UNTERMINATED_COMMAND_ERROR
+        )
+        self.assertEqual(self._read_reply(), "HEARTBEAT")
+
+
+if __name__ == "__main__":
+    unittest.main()